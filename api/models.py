@@ -1,8 +1,13 @@
-from pydantic import BaseModel, Field, field_validator
+import re
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional
 
+_FORBIDDEN_PATTERN = re.compile(r'<script>|javascript:|https?://', re.IGNORECASE)
+
 class StormRequest(BaseModel):
     """Request model for STORM queries."""
+    model_config = ConfigDict(extra='forbid', str_strip_whitespace=True, frozen=True)
+
     topic: str = Field(
         min_length=3,
         max_length=200,
@@ -10,19 +15,21 @@ class StormRequest(BaseModel):
     )
     stream: bool = Field(default=False, description="Enable streaming mode")
     
+    @field_validator('topic', mode='before')
+    @classmethod
+    def reject_blank_topic(cls, v: object) -> object:
+        """Reject blank topics before stripping turns them into a length error."""
+        if isinstance(v, str) and not v.strip():
+            raise ValueError('Topic cannot be empty or whitespace')
+        return v
+
     @field_validator('topic')
     @classmethod
     def validate_topic(cls, v: str) -> str:
         """Validate topic format and content."""
-        v = v.strip()
-        
-        if not v:
-            raise ValueError('Topic cannot be empty or whitespace')
-        
-        forbidden_patterns = ['<script>', 'javascript:', 'http://', 'https://']
-        for pattern in forbidden_patterns:
-            if pattern.lower() in v.lower():
-                raise ValueError(f'Topic contains forbidden pattern: {pattern}')
+        match = _FORBIDDEN_PATTERN.search(v)
+        if match:
+            raise ValueError(f'Topic contains forbidden pattern: {match.group(0).lower()}')
         
         return v
     
@@ -35,4 +42,8 @@ class HealthResponse(BaseModel):
     status: str
     version: str
     timestamp: str
-    uptime: Optional[int] = None
\ No newline at end of file
+    uptime: Optional[int] = None
+
+class CacheClearResponse(BaseModel):
+    """Cache invalidation response model."""
+    cleared: int
\ No newline at end of file
@@ -8,42 +8,168 @@ Endpoints:
     - GET /health: Health check endpoint
     - POST /query: Generate article (sync or streaming)
     - POST /query/stream: Stream article generation progress
+    - DELETE /cache: Invalidate cached articles
 """
 
+import asyncio
+import logging
+import os
+import threading
 import time
-from typing import AsyncGenerator, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple, Union
 
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import StreamingResponse
-from datetime import datetime
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from datetime import datetime, timezone
 
-from api.models import StormRequest, StormResponse, HealthResponse
+from api.models import StormRequest, StormResponse, HealthResponse, CacheClearResponse
 from core.storm_service import StormService
-from utils.logging_config import get_logger
-from utils.middleware import get_request_id
+from utils.cache import CacheEntry, normalize_topic
+from utils.logging_config import get_logger, log_event
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = get_logger(__name__)
 
-_storm_service: StormService = StormService()
+API_VERSION: str = "1.0.0"
+
+# Monotonic, so uptime is unaffected by wall-clock adjustments
+START_MONOTONIC: float = time.monotonic()
+
+# Last formatted health timestamp and the whole second it represents
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+_REQUIRED_ENV_VARS: tuple[str, ...] = ("DEEPSEEK_API_KEY", "SERPER_API_KEY")
+_REQUIRED_ENV_OK: bool = all(os.getenv(var) for var in _REQUIRED_ENV_VARS)
+
+# The one StormService per process; built on first use by get_storm_service()
+_storm_service: Optional[StormService] = None
+_storm_service_lock: threading.Lock = threading.Lock()
+
+
+def _new_storm_executor() -> ThreadPoolExecutor:
+    """Build the bounded worker pool STORM pipeline runs are executed on."""
+    return ThreadPoolExecutor(
+        max_workers=int(os.getenv("STORM_MAX_CONCURRENCY", "8")),
+        thread_name_prefix="storm"
+    )
+
+
+# Pipeline runs get their own bounded pool, sized to the LLM provider's
+# concurrency limit, so long STORM jobs don't starve the shared threadpool.
+# Replaced by start_storm_executor() if a previous app lifespan shut it down.
+_STORM_EXECUTOR: ThreadPoolExecutor = _new_storm_executor()
+_storm_executor_stopped: bool = False
+
+_ERROR_PREFIX: bytes = "❌ Error: ".encode("utf-8")
+
+# Streamed output is coalesced up to this many bytes, but never held longer
+# than the flush interval
+STREAM_BUFFER_SIZE: int = 8192
+STREAM_FLUSH_INTERVAL: float = 0.025
+
+# Last encoded health body and the monotonic time it was built at
+HEALTH_CACHE_TTL: float = float(os.getenv("HEALTH_CACHE_TTL", "1"))
+_last_health: Optional[Tuple[float, bytes]] = None
+
+# Pipeline runs currently in progress, keyed on normalized topic
+_inflight: Dict[str, asyncio.Future] = {}
 
 
 def get_storm_service() -> StormService:
     """
     Return the singleton StormService instance.
 
+    The service is constructed on first call, under a lock, so the process
+    never holds more than one set of LM and retriever clients regardless of
+    how many callers race to get it.
+
     Returns:
         StormService: The shared service instance for STORM operations
 
+    Raises:
+        ValueError: If required API keys are missing
+
     Example:
         >>> service = get_storm_service()
         >>> article = service.run("Python Programming")
     """
+    global _storm_service
+    if _storm_service is None:
+        with _storm_service_lock:
+            if _storm_service is None:
+                _storm_service = StormService()
     return _storm_service
 
 
+def get_existing_storm_service() -> Optional[StormService]:
+    """
+    Return the StormService instance if it has been built, without building it.
+
+    For callers that only act on an existing service and must not construct
+    one (it loads LM and retriever clients and fails without API keys).
+
+    Returns:
+        Optional[StormService]: The shared service, or None if not built yet
+
+    Example:
+        >>> service = get_existing_storm_service()
+        >>> if service is not None:
+        ...     service.invalidate_cache()
+    """
+    return _storm_service
+
+
+def _log_event(message: str, event: str, level: int = logging.INFO, **fields: Any) -> None:
+    """
+    Emit a structured log record for this module.
+
+    Args:
+        message: Human-readable log message
+        event: Machine-readable event name
+        level: Logging level to emit at
+        **fields: Additional structured fields
+
+    Example:
+        >>> _log_event("Query request received", "query_request_received", topic="Python")
+    """
+    log_event(logger, message, event, level, **fields)
+
+
+def start_storm_executor() -> None:
+    """
+    Make sure a running STORM worker pool is available.
+
+    A pool stopped by shutdown_storm_executor() is replaced with a new one,
+    so the app can go through more than one lifespan in the same process.
+
+    Example:
+        >>> start_storm_executor()
+    """
+    global _STORM_EXECUTOR, _storm_executor_stopped
+    if _storm_executor_stopped:
+        _STORM_EXECUTOR = _new_storm_executor()
+        _storm_executor_stopped = False
+
+
+def shutdown_storm_executor() -> None:
+    """
+    Stop the STORM worker pool.
+
+    Queued pipeline runs are cancelled; runs already in progress are allowed
+    to finish, so this blocks until they do and should be called off the
+    event loop.
+
+    Example:
+        >>> await asyncio.to_thread(shutdown_storm_executor)
+    """
+    global _storm_executor_stopped
+    _storm_executor_stopped = True
+    _STORM_EXECUTOR.shutdown(wait=True, cancel_futures=True)
+
+
 def get_uptime() -> int:
     """
     Calculate server uptime in seconds.
@@ -55,14 +181,40 @@ def get_uptime() -> int:
         >>> uptime = get_uptime()
         >>> print(f"Server running for {uptime} seconds")
     """
-    from main import START_TIME
-    return int(time.time() - START_TIME)
+    return int(time.monotonic() - START_MONOTONIC)
+
+
+def utc_timestamp() -> str:
+    """
+    Return the current UTC time as an ISO-8601 string with second precision.
+
+    The formatted string is reused for every call within the same second.
+
+    Returns:
+        str: Timestamp such as "2024-01-01T12:00:00Z"
+
+    Example:
+        >>> utc_timestamp()
+        '2024-01-01T12:00:00Z'
+    """
+    global _timestamp_cache
+
+    now: int = int(time.time())
+    cached_second, cached_text = _timestamp_cache
+    if now != cached_second:
+        cached_text = datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        _timestamp_cache = (now, cached_text)
+    return cached_text
 
 
 def check_environment() -> bool:
     """
     Check if required environment variables are set.
 
+    The check is evaluated once at import; API keys are read the same way by
+    StormService at construction, so a later change would not take effect
+    without a restart anyway.
+
     Returns:
         bool: True if all required environment variables are present, False otherwise
 
@@ -71,15 +223,17 @@ def check_environment() -> bool:
         >>> if not is_configured:
         ...     print("Missing required environment variables")
     """
-    import os
-    required_vars: list[str] = ["DEEPSEEK_API_KEY", "SERPER_API_KEY"]
-    return all(os.getenv(var) for var in required_vars)
+    return _REQUIRED_ENV_OK
 
 
 def check_storm_service() -> bool:
     """
     Check if StormService is initialized and working.
 
+    Only inspects the service built by the app's startup warmup; the check
+    never constructs it, since that would block the event loop. Until the
+    service exists it is reported as not working.
+
     Returns:
         bool: True if StormService is properly initialized, False otherwise
 
@@ -87,90 +241,274 @@ def check_storm_service() -> bool:
         >>> is_healthy = check_storm_service()
         >>> print(f"STORM service healthy: {is_healthy}")
     """
-    try:
-        service: StormService = get_storm_service()
-        return hasattr(service, 'lm_configs') and hasattr(service, 'retriever')
-    except Exception:
-        return False
+    service: Optional[StormService] = get_existing_storm_service()
+    return service is not None and hasattr(service, 'lm_configs') and hasattr(service, 'retriever')
 
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+def _json_bytes_response(body: bytes, headers: Dict[str, str]) -> Response:
     """
-    Health check endpoint for monitoring.
+    Wrap an already-encoded JSON body in a response.
+
+    Args:
+        body: UTF-8 JSON payload
+        headers: Extra response headers
 
     Returns:
-        HealthResponse: Health status including version, timestamp, and uptime
+        Response: application/json response carrying the body as-is
+    """
+    return Response(content=body, media_type="application/json", headers=headers)
 
-    Example:
-        >>> response = client.get("/health")
-        >>> print(response.json())
-        >>> {"status": "healthy", "version": "1.0.0", ...}
+
+def _build_health_body() -> bytes:
+    """
+    Run the health checks and encode a fresh response body.
+
+    Returns:
+        bytes: JSON body matching HealthResponse (status, version, timestamp, uptime)
     """
-    request_id: str = get_request_id()
     env_ok: bool = check_environment()
     service_ok: bool = check_storm_service()
     status: str = "healthy" if env_ok and service_ok else "unhealthy"
 
-    logger.info(
+    _log_event(
         "Health check performed",
-        extra={
-            "event": "health_check",
-            "request_id": request_id,
-            "status": status,
-            "env_ok": env_ok,
-            "service_ok": service_ok
-        }
-    )
-
-    return HealthResponse(
+        "health_check",
         status=status,
-        version="1.0.0",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        uptime=get_uptime()
+        env_ok=env_ok,
+        service_ok=service_ok
     )
 
+    return orjson.dumps({
+        "status": status,
+        "version": API_VERSION,
+        "timestamp": utc_timestamp(),
+        "uptime": get_uptime()
+    })
 
-async def stream_article_generator(topic: str, service: StormService) -> AsyncGenerator[str, None]:
+
+@router.get("/health", response_model=None, responses={200: {"model": HealthResponse}})
+async def health_check() -> Response:
+    """
+    Health check endpoint for monitoring.
+
+    The encoded body is reused for HEALTH_CACHE_TTL seconds so bursts of
+    probes from orchestrators and load balancers don't re-run the checks or
+    re-serialize. If a refresh fails, the last good body is served with
+    X-Cache: STALE. The body is built from a plain dict, skipping
+    HealthResponse validation.
+
+    Returns:
+        Response: JSON health status including version, timestamp, and uptime
+
+    Example:
+        >>> response = client.get("/health")
+        >>> print(response.json())
+        >>> {"status": "healthy", "version": "1.0.0", ...}
+    """
+    global _last_health
+
+    now: float = time.monotonic()
+    if _last_health is not None and now - _last_health[0] < HEALTH_CACHE_TTL:
+        return _json_bytes_response(_last_health[1], {"X-Cache": "HIT"})
+
+    try:
+        body: bytes = _build_health_body()
+    except Exception:
+        if _last_health is None:
+            raise
+        logger.exception(
+            "Health check failed, serving last known status",
+            extra={"event": "health_check_stale"}
+        )
+        return _json_bytes_response(_last_health[1], {"X-Cache": "STALE"})
+
+    _last_health = (now, body)
+    return _json_bytes_response(body, {"X-Cache": "MISS"})
+
+
+async def stream_article_generator(topic: str, service: StormService) -> AsyncGenerator[bytes, None]:
     """
     Async generator that streams article generation progress.
 
-    Runs the STORM pipeline in a thread pool to avoid blocking the event loop.
+    The pipeline runs on the STORM worker pool while progress is consumed on
+    the event loop through StormService.stream(), so the client receives
+    progress incrementally and no extra worker thread is parked waiting for
+    messages. Chunks are UTF-8 encoded before being forwarded.
 
     Args:
         topic: Research topic to generate article about
         service: StormService instance to run the pipeline
 
     Yields:
-        str: Progress messages and article content chunks
-
-    Raises:
-        Exception: If STORM pipeline execution fails
+        bytes: UTF-8 encoded progress messages and article content chunks
 
     Example:
         >>> async for chunk in stream_article_generator("Python", service):
         ...     print(chunk)
     """
     try:
-        # Run streaming in thread pool to avoid blocking event loop
-        for chunk in await run_in_threadpool(service.run_with_streaming, topic):
-            yield chunk
+        async for chunk in service.stream(topic, executor=_STORM_EXECUTOR):
+            yield chunk.encode("utf-8")
     except Exception as e:
-        yield f"❌ Error: {str(e)}\n"
+        yield _ERROR_PREFIX + str(e).encode("utf-8") + b"\n"
 
 
-@router.post("/query")
-async def query(req: StormRequest, service: StormService = Depends(get_storm_service)):
+async def buffer_stream(
+    stream: AsyncGenerator[Union[str, bytes], None],
+    size: int = STREAM_BUFFER_SIZE,
+    max_delay: float = STREAM_FLUSH_INTERVAL
+) -> AsyncGenerator[bytes, None]:
+    """
+    Coalesce small stream chunks into larger writes.
+
+    Each yielded chunk becomes a separate ASGI body message, so many short
+    progress lines cost far more than their size. Chunks are accumulated and
+    flushed once the buffer reaches `size` bytes or the oldest buffered chunk
+    has waited `max_delay` seconds, whichever comes first.
+
+    Args:
+        stream: Source stream of text or UTF-8 encoded chunks
+        size: Flush threshold in bytes
+        max_delay: Maximum time in seconds a chunk may sit in the buffer
+
+    Yields:
+        bytes: Coalesced UTF-8 encoded output
+
+    Example:
+        >>> StreamingResponse(buffer_stream(stream_article_generator(topic, service)))
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    buf: bytearray = bytearray()
+    deadline: Optional[float] = None
+    # The pending __anext__ is kept across flush timeouts; cancelling it
+    # would close the source generator
+    pending: Optional[asyncio.Future] = None
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(stream.__anext__())
+
+            timeout: Optional[float] = None if deadline is None else max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+
+            if not done:
+                yield bytes(buf)
+                buf.clear()
+                deadline = None
+                continue
+
+            finished: asyncio.Future = pending
+            pending = None
+            try:
+                chunk: Any = finished.result()
+            except StopAsyncIteration:
+                break
+
+            buf += chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            if len(buf) >= size:
+                yield bytes(buf)
+                buf.clear()
+                deadline = None
+            elif deadline is None:
+                deadline = loop.time() + max_delay
+
+        if buf:
+            yield bytes(buf)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def run_single_flight(key: str, topic: str, service: StormService) -> Tuple[bytes, CacheEntry]:
+    """
+    Regenerate the article for a topic, sharing the run with concurrent callers.
+
+    If a run for the same key is already in progress, the caller awaits that
+    run instead of starting another one. The shared run is shielded so that a
+    caller disconnecting does not cancel it for everyone else. The JSON
+    payload is encoded once by the run, on the worker thread, and every
+    caller gets the same bytes.
+
+    Args:
+        key: Normalized topic used to identify duplicate requests
+        topic: Research topic as submitted by the client
+        service: StormService instance to run the pipeline
+
+    Returns:
+        Tuple[bytes, CacheEntry]: The encoded {"result": ...} payload and the
+            article as stored in the service's article cache
+
+    Example:
+        >>> payload, entry = await run_single_flight("python", "Python", service)
+    """
+    # No await between lookup and insert, so this is atomic on the event loop
+    future: Optional[asyncio.Future] = _inflight.get(key)
+    if future is None:
+        def refresh() -> Tuple[bytes, CacheEntry]:
+            entry: CacheEntry = service.refresh_article(topic)
+            return orjson.dumps({"result": entry.value}), entry
+
+        future = asyncio.get_running_loop().run_in_executor(_STORM_EXECUTOR, refresh)
+        _inflight[key] = future
+
+        def forget(done: asyncio.Future) -> None:
+            _inflight.pop(key, None)
+            if not done.cancelled():
+                # Mark the exception retrieved in case every caller went away
+                done.exception()
+
+        future.add_done_callback(forget)
+
+    return await asyncio.shield(future)
+
+
+def _cache_headers(entry: CacheEntry, status: str) -> Dict[str, str]:
+    """
+    Build the headers describing the cache status of an article response.
+
+    Args:
+        entry: Cache entry the article was served from or stored into
+        status: Cache outcome (HIT, MISS or STALE)
+
+    Returns:
+        Dict[str, str]: Cache-Control and X-Cache headers
+    """
+    if status == "STALE":
+        cache_control: str = "no-cache"
+    else:
+        cache_control = f"public, max-age={entry.remaining_ttl()}"
+    return {"Cache-Control": cache_control, "X-Cache": status}
+
+
+@router.post(
+    "/query",
+    response_model=None,
+    responses={200: {"model": StormResponse}}
+)
+async def query(
+    req: StormRequest,
+    service: StormService = Depends(get_storm_service)
+) -> Response:
     """
     Generate an article using STORM pipeline.
 
+    Articles come from the service's article cache, shared with
+    /query/stream. A cached article is returned while fresh; once stale it is
+    only served if regeneration fails. Concurrent requests for the same topic
+    share a single pipeline run.
+
+    Payloads are encoded to JSON with orjson and sent as-is, without a
+    response model. A regenerated article is encoded once by the shared run,
+    so coalesced requests all send the same bytes.
+
     Args:
         req: StormRequest containing topic and streaming flag
         service: StormService instance (injected via dependency injection)
 
     Returns:
-        StreamingResponse | StormResponse: Either a streaming response or
-            complete article response based on req.stream flag
+        StreamingResponse | Response: Either a streaming response or
+            complete JSON article response ({"result": ...}) based on req.stream flag
 
     Raises:
         HTTPException: If STORM generation fails with 500 status code
@@ -185,34 +523,77 @@ async def query(req: StormRequest, service: StormService = Depends(get_storm_ser
         >>> for chunk in response.stream_bytes():
         ...     print(chunk.decode())
     """
-    request_id: str = get_request_id()
-    logger.info(
+    _log_event(
         "Query request received",
-        extra={
-            "event": "query_request_received",
-            "request_id": request_id,
-            "topic": req.topic,
-            "stream": req.stream
-        }
+        "query_request_received",
+        topic=req.topic,
+        stream=req.stream
     )
 
-    try:
-        if req.stream:
-            return StreamingResponse(
-                stream_article_generator(req.topic, service),
-                media_type="text/plain"
-            )
-        else:
-            # Run STORM in thread pool to avoid blocking event loop
-            result: str = await run_in_threadpool(service.run, req.topic)
-            return StormResponse(result=result)
+    if req.stream:
+        return StreamingResponse(
+            buffer_stream(stream_article_generator(req.topic, service)),
+            media_type="text/plain"
+        )
 
+    cached: Optional[CacheEntry] = service.cached_article(req.topic)
+    if cached is not None and cached.is_fresh():
+        return _json_bytes_response(orjson.dumps({"result": cached.value}), _cache_headers(cached, "HIT"))
+
+    try:
+        payload, entry = await run_single_flight(normalize_topic(req.topic), req.topic, service)
     except Exception as e:
+        if cached is not None:
+            _log_event(
+                "Serving stale cached article after generation failure",
+                "query_cache_stale",
+                level=logging.WARNING,
+                topic=req.topic,
+                error=str(e)
+            )
+            return _json_bytes_response(orjson.dumps({"result": cached.value}), _cache_headers(cached, "STALE"))
         raise HTTPException(
             status_code=500,
             detail=f"STORM generation failed: {str(e)}"
         )
 
+    return _json_bytes_response(payload, _cache_headers(entry, "MISS"))
+
+
+@router.delete("/cache", response_model=CacheClearResponse)
+async def clear_cache(
+    topic: Optional[str] = None,
+    service: Optional[StormService] = Depends(get_existing_storm_service)
+) -> CacheClearResponse:
+    """
+    Invalidate cached articles.
+
+    Clears the service's article cache used by /query and /query/stream, so
+    the next request regenerates the article. If the service has not been
+    built yet it holds no articles and is left unbuilt.
+
+    Args:
+        topic: Optional topic to invalidate; clears the whole cache if omitted
+        service: StormService instance if already built (injected)
+
+    Returns:
+        CacheClearResponse: Number of cached articles removed
+
+    Example:
+        >>> response = client.delete("/cache", params={"topic": "Python"})
+        >>> print(response.json()["cleared"])
+    """
+    cleared: int = service.invalidate_cache(topic) if service is not None else 0
+
+    _log_event(
+        "Article cache invalidated",
+        "cache_invalidated",
+        topic=topic,
+        cleared=cleared
+    )
+
+    return CacheClearResponse(cleared=cleared)
+
 
 @router.post("/query/stream")
 async def query_stream(req: StormRequest, service: StormService = Depends(get_storm_service)) -> StreamingResponse:
@@ -231,18 +612,13 @@ async def query_stream(req: StormRequest, service: StormService = Depends(get_st
         >>> for chunk in response.stream_bytes():
         ...     print(chunk.decode())
     """
-    request_id: str = get_request_id()
-
-    logger.info(
+    _log_event(
         "Stream request received",
-        extra={
-            "event": "stream_request_received",
-            "request_id": request_id,
-            "topic": req.topic
-        }
+        "stream_request_received",
+        topic=req.topic
     )
 
     return StreamingResponse(
-        stream_article_generator(req.topic, service),
+        buffer_stream(stream_article_generator(req.topic, service)),
         media_type="text/plain"
     )
@@ -1,12 +1,29 @@
 """STORM service wrapper with in-memory storage."""
 
+import asyncio
+import dataclasses
+import hashlib
+import json
 import os
 import queue
+import shutil
+import sys
 import tempfile
 import threading
-from typing import Dict, Generator, List, Optional
-
+import traceback
+import uuid
+import weakref
+from collections import defaultdict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncGenerator, Dict, Generator, Iterator, List, Optional, Tuple
+
+import backoff
+import requests
 from dotenv import load_dotenv
+from dsp import ERRORS, backoff_hdlr, giveup_hdlr
+from requests.adapters import HTTPAdapter
 
 from knowledge_storm import (
     STORMWikiRunner,
@@ -15,29 +32,193 @@ from knowledge_storm import (
     DeepSeekModel,
 )
 from knowledge_storm.rm import SerperRM
+from knowledge_storm.storm_wiki.modules.storm_dataclass import StormInformationTable
 from knowledge_storm.utils import FileIOHelper
-from core.streaming_callback import StreamingCallbackHandler
+from sentence_transformers import SentenceTransformer
+from core.streaming_callback import StreamingCallbackHandler, acquire_handler, release_handler
+from utils.cache import CacheEntry, TTLCache, normalize_topic
+from utils.logging_config import get_logger
+
+def _utf8_len(s: str) -> int:
+    """Return the UTF-8 encoded length of s, without encoding ASCII text."""
+    return len(s) if s.isascii() else len(s.encode("utf-8"))
+
+class _MemFS:
+    """
+    In-memory file store indexed as a path trie.
+
+    Files are stored in nested dicts keyed on "/"-separated path segments, so
+    listing a directory only walks the subtree under it and a shared prefix
+    is stored once rather than in every key. Segments are interned, so the
+    directory and file names STORM repeats for every topic share one string.
+    A basename index maps each file name to the full paths stored under it
+    for direct lookups of well-known STORM outputs. Supports the read-only
+    mapping operations the previous flat dict was used with (``[]``, ``in``,
+    ``len``, ``keys``). Every store registers itself in _LIVE_STORES until it
+    is garbage collected, so the public memory helpers can report on the
+    per-run stores of pipelines that are in progress.
+
+    Example:
+        >>> fs = _MemFS()
+        >>> fs.write("out/Python/storm_gen_article.txt", "text")
+        >>> fs.find("storm_gen_article.txt")
+        ['out/Python/storm_gen_article.txt']
+    """
+
+    # Key under which a node stores its file content; path segments are
+    # always str, so None cannot collide with them
+    _FILE = None
+
+    def __init__(self) -> None:
+        self.root: Dict = {}
+        self.by_basename: Dict[str, List[str]] = defaultdict(list)
+        self._size: int = 0
+        self._lock = threading.Lock()
+        with _live_stores_lock:
+            _LIVE_STORES.add(self)
+
+    def _node(self, path: str) -> Optional[Dict]:
+        """Return the trie node for a path, or None if it does not exist."""
+        node: Optional[Dict] = self.root
+        for segment in path.split("/"):
+            node = node.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def write(self, path: str, content: str) -> None:
+        """Store content at path, replacing any existing file."""
+        segments: List[str] = [sys.intern(segment) for segment in path.split("/")]
+        with self._lock:
+            node: Dict = self.root
+            for segment in segments:
+                node = node.setdefault(segment, {})
+            if self._FILE not in node:
+                self._size += 1
+                self.by_basename[segments[-1]].append(path)
+            node[self._FILE] = content
+
+    def read(self, path: str, default: Optional[str] = None) -> Optional[str]:
+        """Return the content stored at path, or default if absent."""
+        node: Optional[Dict] = self._node(path)
+        if node is None or self._FILE not in node:
+            return default
+        return node[self._FILE]
+
+    def list(self, directory: str = "") -> List[str]:
+        """Return the full paths of all files under a directory."""
+        directory = directory.rstrip("/")
+        with self._lock:
+            node: Optional[Dict] = self._node(directory) if directory else self.root
+            if node is None:
+                return []
+            return [path for path, _ in self._walk(node, directory)]
+
+    def _walk(self, node: Dict, prefix: str) -> Generator[Tuple[str, str], None, None]:
+        """Yield (path, content) for every file strictly beneath node."""
+        stack: List[Tuple[Dict, str]] = [(node, prefix)]
+        while stack:
+            current, current_path = stack.pop()
+            for segment, child in current.items():
+                if segment is self._FILE:
+                    continue
+                child_path: str = f"{current_path}/{segment}" if current is not self.root else segment
+                if self._FILE in child:
+                    yield child_path, child[self._FILE]
+                stack.append((child, child_path))
+
+    def nbytes(self) -> int:
+        """Return the UTF-8 size of all stored paths and contents."""
+        with self._lock:
+            return sum(
+                _utf8_len(path) + _utf8_len(content)
+                for path, content in self._walk(self.root, "")
+            )
+
+    def find(self, basename: str) -> List[str]:
+        """Return the full paths of all files with the given basename."""
+        return self.by_basename.get(basename, [])
+
+    def clear(self) -> None:
+        """Remove all files."""
+        with self._lock:
+            self.root = {}
+            self.by_basename = defaultdict(list)
+            self._size = 0
+
+    def get(self, path: str, default: Optional[str] = None) -> Optional[str]:
+        """Dict-style alias for read()."""
+        return self.read(path, default)
+
+    def keys(self) -> List[str]:
+        """Return the full paths of all stored files."""
+        return self.list()
+
+    def __getitem__(self, path: str) -> str:
+        content: Optional[str] = self.read(path)
+        if content is None:
+            raise KeyError(path)
+        return content
 
-_IN_MEMORY_STORAGE: Dict[str, str] = {}
+    def __contains__(self, path: str) -> bool:
+        return self.read(path) is not None
 
-def _normalize_path(file_path: str) -> str:
+    def __len__(self) -> int:
+        return self._size
+
+# Every _MemFS still alive: the process-wide store plus one per pipeline run in
+# progress. Read by the public memory helpers; entries drop out when a run's
+# store is garbage collected.
+_LIVE_STORES: "weakref.WeakSet[_MemFS]" = weakref.WeakSet()
+_live_stores_lock = threading.Lock()
+
+
+def _live_stores() -> List[_MemFS]:
+    """Return a snapshot of every live in-memory store."""
+    with _live_stores_lock:
+        return list(_LIVE_STORES)
+
+
+# Process-wide store, used outside of pipeline runs (e.g. by tests)
+_IN_MEMORY_STORAGE: _MemFS = _MemFS()
+
+# Store used by the current context; each pipeline run installs a fresh one so
+# concurrent runs never share files and a run's files are dropped with it
+_STORAGE_CTX: ContextVar[_MemFS] = ContextVar("storm_storage", default=_IN_MEMORY_STORAGE)
+
+def _storage() -> _MemFS:
+    """Return the in-memory store for the current context."""
+    return _STORAGE_CTX.get()
+
+_SLASH_TABLE = str.maketrans({"\\": "/"})
+
+def _normalize_path(file_path: str, _table=_SLASH_TABLE) -> str:
     """Normalize file path to use forward slashes."""
-    return file_path.replace("\\", "/")
+    if "\\" not in file_path:
+        return file_path
+    return file_path.translate(_table)
+
+# The helpers below are called by STORM through FileIOHelper for every file
+# operation, so the store lookup and path normalizer are bound as default
+# arguments and resolved as locals instead of module globals on each call.
 
-def _write_in_memory(s: str, file_path: str) -> None:
+def _write_in_memory(s: str, file_path: str, _get_store=_STORAGE_CTX.get, _norm=_normalize_path) -> None:
     """Store file content in memory."""
-    key = _normalize_path(file_path)
-    _IN_MEMORY_STORAGE[key] = s
+    _get_store().write(_norm(file_path), s)
 
-def _read_in_memory(file_path: str) -> str:
-    """Read file content from memory."""
-    key = _normalize_path(file_path)
-    return _IN_MEMORY_STORAGE.get(key, "")
+def _read_in_memory(file_path: str, _get_store=_STORAGE_CTX.get, _norm=_normalize_path) -> str:
+    """
+    Read file content from memory.
 
-def _exists_in_memory(file_path: str) -> bool:
+    Contents are kept as the str STORM wrote, and reads return that same
+    object, so no copy is made. Storing bytes would instead make every
+    read_str decode the whole file again.
+    """
+    return _get_store().read(_norm(file_path), "")
+
+def _exists_in_memory(file_path: str, _get_store=_STORAGE_CTX.get, _norm=_normalize_path) -> bool:
     """Check if file exists in memory storage."""
-    key = _normalize_path(file_path)
-    return key in _IN_MEMORY_STORAGE
+    return _norm(file_path) in _get_store()
 
 def _list_files_in_memory(directory: str = "") -> List[str]:
     """
@@ -53,17 +234,172 @@ def _list_files_in_memory(directory: str = "") -> List[str]:
         >>> files = _list_files_in_memory("topic")
         >>> print(files)
     """
-    prefix: str = _normalize_path(directory)
-    if not prefix.endswith("/") and prefix:
-        prefix += "/"
-    return [key for key in _IN_MEMORY_STORAGE.keys() if key.startswith(prefix)]
+    return _storage().list(_normalize_path(directory))
 
 def clear_memory_storage() -> None:
     """Clear all in-memory file storage."""
-    _IN_MEMORY_STORAGE.clear()
+    _storage().clear()
+
+def _dump_json_in_memory(obj, file_name: str, encoding: str = "utf-8") -> None:
+    """Store an object as JSON in memory."""
+    _write_in_memory(json.dumps(obj, default=FileIOHelper.handle_non_serializable), file_name)
+
+def _load_json_in_memory(file_name: str, encoding: str = "utf-8"):
+    """Load a JSON object from memory."""
+    return json.loads(_read_in_memory(file_name))
 
 FileIOHelper.write_str = staticmethod(_write_in_memory)
 FileIOHelper.read_str = staticmethod(_read_in_memory)
+FileIOHelper.load_str = staticmethod(_read_in_memory)
+FileIOHelper.dump_json = staticmethod(_dump_json_in_memory)
+FileIOHelper.load_json = staticmethod(_load_json_in_memory)
+
+# STORMWikiRunner.run() creates <output_dir>/<topic> with os.makedirs even
+# though every file goes to memory, so output_dir must be a real, writable
+# directory. One empty scratch directory is shared by every run and removed
+# when the process exits.
+_scratch_dir: Optional[tempfile.TemporaryDirectory] = None
+_scratch_dir_lock = threading.Lock()
+
+def _get_scratch_dir() -> str:
+    """Return the process-wide STORM output directory, creating it on first use."""
+    global _scratch_dir
+    if _scratch_dir is None:
+        with _scratch_dir_lock:
+            if _scratch_dir is None:
+                _scratch_dir = tempfile.TemporaryDirectory(prefix="storm-api-")
+    return _scratch_dir.name
+
+def _new_run_dir() -> str:
+    """Return a unique output directory for one pipeline run."""
+    return os.path.join(_get_scratch_dir(), uuid.uuid4().hex)
+
+def _discard_run_dir(run_dir: str) -> None:
+    """Remove a finished run's (empty) on-disk output directories."""
+    shutil.rmtree(run_dir, ignore_errors=True)
+
+# STORM loads this embedding model from disk on every run to rank snippets
+# for article generation; load it once and share it across runs instead.
+_ENCODER_MODEL = "paraphrase-MiniLM-L6-v2"
+_shared_encoder: Optional[SentenceTransformer] = None
+_shared_encoder_lock = threading.Lock()
+
+def _get_shared_encoder() -> SentenceTransformer:
+    """Return the process-wide sentence encoder, loading it on first use."""
+    global _shared_encoder
+    if _shared_encoder is None:
+        with _shared_encoder_lock:
+            if _shared_encoder is None:
+                _shared_encoder = SentenceTransformer(_ENCODER_MODEL)
+    return _shared_encoder
+
+def _prepare_table_for_retrieval(self: StormInformationTable) -> None:
+    """StormInformationTable.prepare_table_for_retrieval using the shared encoder."""
+    self.encoder = _get_shared_encoder()
+    self.collected_urls = []
+    self.collected_snippets = []
+    for url, information in self.url_to_info.items():
+        for snippet in information.snippets:
+            self.collected_urls.append(url)
+            self.collected_snippets.append(snippet)
+    self.encoded_snippets = self.encoder.encode(self.collected_snippets)
+
+StormInformationTable.prepare_table_for_retrieval = _prepare_table_for_retrieval
+
+# STORM's DeepSeek and Serper clients call requests.post/request directly, so
+# every LLM call and search opens a fresh TCP+TLS connection. Route them
+# through one pooled session so connections are kept alive across calls and
+# pipeline runs.
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session, creating it on first use.
+
+    Returns:
+        requests.Session: Session with a keep-alive connection pool of
+        HTTP_POOL_SIZE connections per host
+
+    Example:
+        >>> session = get_http_session()
+        >>> session is get_http_session()
+        True
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                pool_size = int(os.getenv("HTTP_POOL_SIZE", "50"))
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
+def close_http_session() -> None:
+    """Close the process-wide HTTP session and its pooled connections."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
+class PooledDeepSeekModel(DeepSeekModel):
+    """DeepSeekModel that sends completions through the shared HTTP session."""
+
+    @backoff.on_exception(
+        backoff.expo,
+        ERRORS,
+        max_time=1000,
+        on_backoff=backoff_hdlr,
+        giveup=giveup_hdlr,
+    )
+    def _create_completion(self, prompt: str, **kwargs):
+        """Create a completion using the DeepSeek API."""
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+        data = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            **kwargs,
+        }
+        response = get_http_session().post(
+            f"{self.api_base}/v1/chat/completions", headers=headers, json=data
+        )
+        response.raise_for_status()
+        return response.json()
+
+class PooledSerperRM(SerperRM):
+    """
+    SerperRM that sends searches through the shared HTTP session.
+
+    Upstream serper_runner calls requests.request directly with no way to
+    pass a session in, so the request is rebuilt here. Searches time out
+    after SERPER_TIMEOUT seconds and failed responses raise, as upstream.
+    """
+
+    def serper_runner(self, query_params):
+        """Run a Serper search for the given query parameters."""
+        self.search_url = f"{self.base_url}/search"
+        headers = {
+            "X-API-KEY": self.serper_search_api_key,
+            "Content-Type": "application/json",
+        }
+        response = get_http_session().post(
+            self.search_url,
+            headers=headers,
+            json=query_params,
+            timeout=float(os.getenv("SERPER_TIMEOUT", "30")),
+        )
+        if not response.ok:
+            raise RuntimeError(
+                f"Error had occurred while running the search process.\n Error is {response.reason}, had failed with status code {response.status_code}"
+            )
+        return response.json()
 
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 load_dotenv()
@@ -73,7 +409,27 @@ DEFAULT_MAX_PERSPECTIVE = 2
 DEFAULT_MAX_SEARCH_QUERIES = 2
 DEFAULT_SEARCH_TOP_K = 2
 DEFAULT_RETRIEVE_TOP_K = 2
-DEFAULT_MAX_THREAD_NUM = 2
+# Research conversations are independent chains of LLM and search calls, so
+# the thread count is bounded by provider rate limits rather than CPU
+DEFAULT_MAX_THREAD_NUM = min(32, (os.cpu_count() or 1) * 4)
+
+logger = get_logger(__name__)
+
+# Streamed after the pipeline finishes, for each stage that ran
+_STAGE_BANNERS = (
+    ("do_research", "✅ Research phase complete\n\n"),
+    ("do_generate_outline", "📝 Outline generated\n\n"),
+    ("do_generate_article", "✍️  Article generated\n\n"),
+    ("do_polish_article", "✨ Article polished\n\n"),
+)
+_ARTICLE_HEADER = "📄 Final Article:\n────────────────────────────────────────\n\n"
+
+# Final articles keyed on a hash of the topic, pipeline stages and LM
+# parameters, so identical requests skip the STORM pipeline entirely
+_article_cache: TTLCache = TTLCache(
+    maxsize=int(os.getenv("ARTICLE_CACHE_SIZE", "100")),
+    ttl=int(os.getenv("ARTICLE_CACHE_TTL", "3600"))
+)
 
 class StormService:
     """
@@ -96,6 +452,31 @@ class StormService:
         """Initialize STORM service with LLM and retriever configurations"""
         self.lm_configs = self._setup_llm()
         self.retriever = self._setup_retriever()
+        # Environment configuration is fixed for the life of the process, so
+        # resolve it once instead of on every run
+        self._runner_args_template = self._load_runner_args()
+        self._pipeline_config = self._load_pipeline_config()
+        self._runner_pool: "queue.LifoQueue[STORMWikiRunner]" = queue.LifoQueue()
+        self._debug = os.getenv("STORM_DEBUG") == "1"
+
+    def warmup(self) -> None:
+        """
+        Load resources the pipeline would otherwise load on the first run.
+
+        Loads the shared sentence encoder used for snippet retrieval (fetching
+        the model if it is not cached locally yet), opens the pooled HTTP
+        session, and builds a STORM runner into the runner pool. Safe to call
+        repeatedly.
+
+        Example:
+            >>> service = StormService()
+            >>> service.warmup()
+        """
+        _get_shared_encoder()
+        get_http_session()
+        if self._runner_pool.empty():
+            with self._checkout_runner(_get_scratch_dir()):
+                pass
 
     # -------------------------------------------------------------------------
     # Configuration Methods
@@ -118,7 +499,7 @@ class StormService:
             )
 
         # Create DeepSeek model instance
-        lm = DeepSeekModel(
+        lm = PooledDeepSeekModel(
             model="deepseek-chat",
             api_key=api_key,
             temperature=0.7,
@@ -151,7 +532,7 @@ class StormService:
                 "SERPER_API_KEY required. Get free key at: https://serper.dev/"
             )
 
-        return SerperRM(
+        return PooledSerperRM(
             serper_search_api_key=api_key,
             k=self._get_int_env("SEARCH_TOP_K", DEFAULT_SEARCH_TOP_K)
         )
@@ -171,14 +552,17 @@ class StormService:
     # Pipeline Execution
     # -------------------------------------------------------------------------
 
-    def run(self, topic: str) -> str:
+    def run(self, topic: str, use_cache: bool = True) -> str:
         """
         Execute the complete STORM pipeline for a given topic.
 
         All file operations are performed in-memory without touching the disk.
+        A fresh article generated earlier with the same topic, pipeline stages
+        and LM parameters is returned without running the pipeline.
 
         Args:
             topic: Research topic to generate article about
+            use_cache: Whether to read and populate the article cache
 
         Returns:
             Generated article text in Markdown format
@@ -186,30 +570,86 @@ class StormService:
         Raises:
             Exception: If pipeline execution fails
         """
-        # Clear any previous in-memory storage
-        clear_memory_storage()
+        pipeline_config = self._get_pipeline_config()
+        cache_key = self._cache_key(topic, pipeline_config)
+        if use_cache:
+            cached: Optional[CacheEntry] = _article_cache.get(cache_key)
+            if cached is not None and cached.is_fresh():
+                return cached.value
+
+        article = self._generate(topic, pipeline_config)
+        if use_cache:
+            _article_cache.set(cache_key, article)
+        return article
+
+    def cached_article(self, topic: str) -> Optional[CacheEntry]:
+        """
+        Look up the cached article for a topic without running the pipeline.
 
-        try:
-            # Step 1: Configure pipeline parameters
-            # Use temporary directory path - files won't be written to disk
-            import tempfile
-            temp_dir = tempfile.mkdtemp()
-            args = self._build_runner_args(temp_dir)
+        Args:
+            topic: Research topic
 
-            # Step 2: Create STORM runner
-            runner = STORMWikiRunner(
-                args=args,
-                lm_configs=self.lm_configs,
-                rm=self.retriever
-            )
+        Returns:
+            Optional[CacheEntry]: The entry (fresh or stale), or None if not cached
+
+        Example:
+            >>> entry = service.cached_article("Python")
+            >>> if entry is not None and entry.is_fresh():
+            ...     print(entry.value)
+        """
+        return _article_cache.get(self._cache_key(topic, self._get_pipeline_config()))
+
+    def refresh_article(self, topic: str) -> CacheEntry:
+        """
+        Run the pipeline for a topic and cache the article, even if one is cached.
+
+        If the run fails the previously cached article, fresh or stale, is
+        left in place.
+
+        Args:
+            topic: Research topic to generate article about
+
+        Returns:
+            CacheEntry: The newly cached article
+
+        Raises:
+            Exception: If pipeline execution fails
+
+        Example:
+            >>> entry = service.refresh_article("Python")
+            >>> entry.remaining_ttl()
+            3600
+        """
+        pipeline_config = self._get_pipeline_config()
+        article = self._generate(topic, pipeline_config)
+        return _article_cache.set(self._cache_key(topic, pipeline_config), article)
+
+    def _generate(self, topic: str, pipeline_config: Dict[str, bool]) -> str:
+        """
+        Run the pipeline for a topic, bypassing the article cache.
 
-            # Step 3: Determine which stages to run
-            pipeline_config = self._get_pipeline_config()
+        Args:
+            topic: Research topic to generate article about
+            pipeline_config: Stages to run
+
+        Returns:
+            str: Generated article text
+
+        Raises:
+            Exception: If pipeline execution fails
+        """
+        # Each run gets its own in-memory store and output directory so
+        # concurrent runs never see or clear each other's files
+        run_dir = _new_run_dir()
+        storage_token = _STORAGE_CTX.set(_MemFS())
 
-            # Step 4: Execute STORM pipeline (all files stored in memory)
-            runner.run(topic=topic, **pipeline_config)
+        try:
+            # Step 1: Check out a STORM runner and execute the pipeline
+            # (all files stored in memory)
+            with self._checkout_runner(run_dir) as runner:
+                runner.run(topic=topic, **pipeline_config)
 
-            # Step 5: Retrieve article from memory and return
+            # Step 2: Retrieve article from memory and return
             return self._get_article_from_memory(pipeline_config)
 
         except AssertionError as e:
@@ -219,17 +659,49 @@ class StormService:
             if "RatelimitException" in type(e).__name__:
                 raise Exception("Search rate limit exceeded. Try again in a few moments.")
             raise self._format_error("Pipeline execution failed", error_msg)
+        finally:
+            _STORAGE_CTX.reset(storage_token)
+            _discard_run_dir(run_dir)
 
-    def run_with_streaming(self, topic: str, callback_handler: Optional[StreamingCallbackHandler] = None) -> Generator[str, None, None]:
+    def run_batch(self, topics: List[str], max_concurrency: int = 4) -> List[str]:
+        """
+        Execute the STORM pipeline for several topics concurrently.
+
+        Every topic is submitted before any result is awaited, so up to
+        max_concurrency pipelines run at once.
+
+        Args:
+            topics: Research topics to generate articles about
+            max_concurrency: Maximum number of pipelines running at once
+
+        Returns:
+            List[str]: Generated articles, in the same order as topics
+
+        Raises:
+            Exception: The first failure, in topic order, if any run fails
+
+        Example:
+            >>> articles = service.run_batch(["Python", "Rust", "Go"])
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="storm-batch") as executor:
+            futures = [executor.submit(self.run, topic) for topic in topics]
+            return [future.result() for future in futures]
+
+    def run_with_streaming(self, topic: str, callback_handler: Optional[StreamingCallbackHandler] = None, use_cache: bool = True) -> Generator[str, None, None]:
         """
         Execute STORM pipeline with streaming progress updates.
 
         This method yields progress messages at each stage of the STORM pipeline
         using the callback handler, providing real-time feedback to the user.
+        A cached article for the same topic and configuration is streamed
+        straight away without running the pipeline. This is the synchronous
+        counterpart of stream(): both drive _run_streaming_pipeline() and
+        report failures through _streaming_error().
 
         Args:
             topic: Research topic to generate article about
             callback_handler: Optional callback handler for streaming progress
+            use_cache: Whether to read and populate the article cache
 
         Yields:
             str: Progress messages and the final article
@@ -237,161 +709,219 @@ class StormService:
         Raises:
             Exception: If pipeline execution fails
         """
-        # Clear any previous in-memory storage
-        clear_memory_storage()
+        pipeline_config = self._get_pipeline_config()
+        cache_key = self._cache_key(topic, pipeline_config)
+        cached = self._cached_chunks(topic, cache_key) if use_cache else None
+        if cached is not None:
+            yield from cached
+            return
 
         # Create callback handler if not provided
         if callback_handler is None:
             callback_handler = StreamingCallbackHandler(topic=topic)
 
         callback_handler.clear_progress()
+        yield f"🔍 Starting research on: {topic}\n\n"
+
+        # Run STORM in a background thread; the handler is finished when the
+        # run ends, which ends the progress loop below
+        pipeline: Future = Future()
+
+        def run_storm():
+            try:
+                pipeline.set_result(
+                    self._run_streaming_pipeline(topic, callback_handler, pipeline_config)
+                )
+            except Exception as e:
+                pipeline.set_exception(e)
 
-        # Result storage to get the article after STORM completes
-        result_container = {"article": None, "error": None, "config": None}
+        threading.Thread(target=run_storm, daemon=True).start()
 
+        # Yield messages as they arrive from the callback handler; an empty
+        # batch means the STORM thread has finished and every message has
+        # been drained
         try:
-            # Yield initial message
-            yield f"🔍 Starting research on: {topic}\n\n"
+            while True:
+                messages = callback_handler.wait_for_progress()
+                if not messages:
+                    break
+                yield "\n".join(messages) + "\n"
+        finally:
+            # If the consumer stopped reading mid-run, stop formatting and
+            # buffering progress nobody will read
+            if not callback_handler.message_queue.closed:
+                callback_handler.enabled = False
 
-            # Configure pipeline parameters
-            args = self._build_runner_args("/dev/null")
+        try:
+            article: str = pipeline.result()
+        except Exception as e:
+            message, error = self._streaming_error(e)
+            yield message
+            raise error from e
 
-            # Create STORM runner
-            runner = STORMWikiRunner(
-                args=args,
-                lm_configs=self.lm_configs,
-                rm=self.retriever
-            )
+        yield self._completion_chunk(pipeline_config)
 
-            # Determine which stages to run
-            pipeline_config = self._get_pipeline_config()
-            result_container["config"] = pipeline_config
-
-            # Function to run STORM in a separate thread
-            def run_storm():
-                try:
-                    # Execute STORM pipeline with callback handler
-                    runner.run(topic=topic, callback_handler=callback_handler, **pipeline_config)
-                    # Retrieve article and store it
-                    result_container["article"] = self._get_article_from_memory(pipeline_config)
-                except Exception as e:
-                    result_container["error"] = e
-
-            # Start STORM in a background thread
-            storm_thread = threading.Thread(target=run_storm, daemon=True)
-            storm_thread.start()
-
-            # Yield messages as they arrive from the callback handler
-            while storm_thread.is_alive():
-                try:
-                    # Get any new messages from the queue
-                    message = callback_handler.message_queue.get(timeout=0.1)
-                    yield f"{message}\n"
-                except queue.Empty:
-                    # No new messages, continue checking
-                    continue
+        if use_cache:
+            _article_cache.set(cache_key, article)
+        yield article
 
-            # Wait for thread to complete and get any remaining messages
-            storm_thread.join(timeout=5)
+    async def stream(self, topic: str, executor: Optional[Executor] = None, use_cache: bool = True) -> AsyncGenerator[str, None]:
+        """
+        Execute STORM pipeline with streaming progress updates, on an event loop.
 
-            # Yield any remaining messages
-            while not callback_handler.message_queue.empty():
-                try:
-                    message = callback_handler.message_queue.get_nowait()
-                    yield f"{message}\n"
-                except queue.Empty:
-                    break
+        Yields the same chunks as run_with_streaming(). The pipeline runs in
+        the given executor and its progress callbacks wake the event loop
+        directly, so no thread is held waiting for progress messages.
 
-            # Check for errors
-            if result_container["error"]:
-                error_msg = str(result_container["error"])
-                if "RatelimitException" in type(result_container["error"]).__name__:
-                    yield "❌ Search rate limit exceeded. Try again in a few moments.\n"
-                    raise Exception("Search rate limit exceeded. Try again in a few moments.")
-                yield f"❌ Pipeline execution failed: {error_msg}\n"
-                raise self._format_error("Pipeline execution failed", error_msg)
+        Args:
+            topic: Research topic to generate article about
+            executor: Executor to run the pipeline in (the loop's default if None)
+            use_cache: Whether to read and populate the article cache
 
-            # Yield stage completion messages
-            yield "\n"
+        Yields:
+            str: Progress messages and the final article
 
-            if pipeline_config.get("do_research"):
-                yield "✅ Research phase complete\n\n"
+        Raises:
+            Exception: If pipeline execution fails
 
-            if pipeline_config.get("do_generate_outline"):
-                yield "📝 Outline generated\n\n"
+        Example:
+            >>> async for chunk in service.stream("Python"):
+            ...     print(chunk, end="")
+        """
+        pipeline_config = self._get_pipeline_config()
+        cache_key = self._cache_key(topic, pipeline_config)
+        cached = self._cached_chunks(topic, cache_key) if use_cache else None
+        if cached is not None:
+            for chunk in cached:
+                yield chunk
+            return
+
+        callback_handler = acquire_handler(topic)
+        yield f"🔍 Starting research on: {topic}\n\n"
+
+        pipeline: asyncio.Future = asyncio.get_running_loop().run_in_executor(
+            executor, self._run_streaming_pipeline, topic, callback_handler, pipeline_config
+        )
+        # The run completes even if the client goes away mid-stream; mark
+        # its exception retrieved so an abandoned failure is not reported
+        pipeline.add_done_callback(lambda done: done.cancelled() or done.exception())
 
-            if pipeline_config.get("do_generate_article"):
-                yield "✍️  Article generated\n\n"
+        try:
+            async for messages in callback_handler.stream():
+                yield "\n".join(messages) + "\n"
+        finally:
+            # If the client went away mid-run, stop formatting and buffering
+            # progress nobody will read
+            if not callback_handler.message_queue.closed:
+                callback_handler.enabled = False
 
-            if pipeline_config.get("do_polish_article"):
-                yield "✨ Article polished\n\n"
+        try:
+            article: str = await pipeline
+        except Exception as e:
+            message, error = self._streaming_error(e)
+            yield message
+            raise error from e
+        finally:
+            release_handler(callback_handler)
 
-            yield "📄 Final Article:\n"
-            yield "────────────────────────────────────────\n\n"
+        yield self._completion_chunk(pipeline_config)
 
-            # Yield final article
-            yield result_container["article"]
+        if use_cache:
+            _article_cache.set(cache_key, article)
+        yield article
 
-        except AssertionError as e:
-            yield f"❌ Assertion error: {str(e)}\n"
-            raise self._format_error("Assertion error", str(e))
-        except Exception as e:
-            error_msg = str(e)
-            if "RatelimitException" in type(e).__name__:
-                yield "❌ Search rate limit exceeded. Try again in a few moments.\n"
-                raise Exception("Search rate limit exceeded. Try again in a few moments.")
-            yield f"❌ Pipeline execution failed: {error_msg}\n"
-            raise self._format_error("Pipeline execution failed", error_msg)
+    def invalidate_cache(self, topic: Optional[str] = None) -> int:
         """
-        Execute the complete STORM pipeline for a given topic.
-        
-        All file operations are performed in-memory without touching the disk.
-        
+        Drop cached articles so the next request regenerates them.
+
+        Args:
+            topic: Optional topic to invalidate; clears every article if omitted
+
+        Returns:
+            int: Number of cached articles removed
+
+        Example:
+            >>> service.invalidate_cache("Python")
+            1
+        """
+        if topic is None:
+            return _article_cache.clear()
+        return int(_article_cache.invalidate(self._cache_key(topic, self._get_pipeline_config())))
+
+    def _run_streaming_pipeline(self, topic: str, callback_handler: StreamingCallbackHandler, pipeline_config: Dict[str, bool]) -> str:
+        """
+        Run the pipeline with a callback handler and return the article.
+
+        Runs in a worker thread with its own in-memory store and output
+        directory. The handler is finished when the run ends, whether or not
+        it succeeded, so consumers waiting on it are released.
+
         Args:
             topic: Research topic to generate article about
-            
+            callback_handler: Handler receiving progress from the pipeline
+            pipeline_config: Stages to run
+
         Returns:
-            Generated article text in Markdown format
-            
-        Raises:
-            Exception: If pipeline execution fails
+            str: Generated article text
         """
-        # Clear any previous in-memory storage
-        clear_memory_storage()
-        
+        run_dir = _new_run_dir()
+        storage_token = _STORAGE_CTX.set(_MemFS())
         try:
-            # Step 1: Configure pipeline parameters
-            # Use dummy path - files won't be written to disk
-            args = self._build_runner_args("/dev/null")
-            
-            # Step 2: Create STORM runner
-            runner = STORMWikiRunner(
-                args=args,
-                lm_configs=self.lm_configs,
-                rm=self.retriever
-            )
-            
-            # Step 3: Determine which stages to run
-            pipeline_config = self._get_pipeline_config()
-            
-            # Step 4: Execute STORM pipeline (all files stored in memory)
-            runner.run(topic=topic, **pipeline_config)
-            
-            # Step 5: Retrieve article from memory and return
+            with self._checkout_runner(run_dir) as runner:
+                runner.run(topic=topic, callback_handler=callback_handler, **pipeline_config)
             return self._get_article_from_memory(pipeline_config)
-                
-        except AssertionError as e:
-            raise self._format_error("Assertion error", str(e))
-        except Exception as e:
-            error_msg = str(e)
-            if "RatelimitException" in type(e).__name__:
-                raise Exception("Search rate limit exceeded. Try again in a few moments.")
-            raise self._format_error("Pipeline execution failed", error_msg)
+        finally:
+            _STORAGE_CTX.reset(storage_token)
+            _discard_run_dir(run_dir)
+            callback_handler.finish()
 
-    def _build_runner_args(self, output_dir: str) -> STORMWikiRunnerArguments:
-        """Build STORM runner arguments from environment configuration"""
-        return STORMWikiRunnerArguments(
-            output_dir=output_dir,
+    def _cached_chunks(self, topic: str, cache_key: str) -> Optional[List[str]]:
+        """
+        Return the chunks streamed for a fresh cached article, if there is one.
+
+        Args:
+            topic: Research topic being streamed
+            cache_key: Article cache key for the topic and configuration
+
+        Returns:
+            Optional[List[str]]: Start message with article header, then the article
+        """
+        cached: Optional[CacheEntry] = _article_cache.get(cache_key)
+        if cached is None or not cached.is_fresh():
+            return None
+        return [f"🔍 Starting research on: {topic}\n\n{_ARTICLE_HEADER}", cached.value]
+
+    def _completion_chunk(self, pipeline_config: Dict[str, bool]) -> str:
+        """Return the stage completion messages and the article header as one chunk."""
+        return "".join(
+            ["\n"]
+            + [banner for stage, banner in _STAGE_BANNERS if pipeline_config.get(stage)]
+            + [_ARTICLE_HEADER]
+        )
+
+    def _streaming_error(self, error: Exception) -> Tuple[str, Exception]:
+        """
+        Build the progress line and exception reported for a failed streaming run.
+
+        Args:
+            error: Exception raised by the pipeline
+
+        Returns:
+            Tuple[str, Exception]: Message to yield to the client and exception to raise
+        """
+        if "RatelimitException" in type(error).__name__:
+            message = "Search rate limit exceeded. Try again in a few moments."
+            return f"❌ {message}\n", Exception(message)
+        error_msg = str(error)
+        return (
+            f"❌ Pipeline execution failed: {error_msg}\n",
+            self._format_error("Pipeline execution failed", error_msg)
+        )
+
+    def _load_runner_args(self) -> STORMWikiRunnerArguments:
+        """Read STORM runner arguments from environment configuration"""
+        args = STORMWikiRunnerArguments(
+            output_dir="",
             max_conv_turn=self._get_int_env("MAX_CONV_TURN", DEFAULT_MAX_CONV_TURN),
             max_perspective=self._get_int_env("MAX_PERSPECTIVE", DEFAULT_MAX_PERSPECTIVE),
             max_search_queries_per_turn=self._get_int_env(
@@ -404,6 +934,81 @@ class StormService:
             max_thread_num=self._get_int_env("MAX_THREAD_NUM", DEFAULT_MAX_THREAD_NUM)
         )
 
+        # STORM simulates one conversation per perspective plus a default
+        # "basic fact writer" one, all in a pool of max_thread_num workers
+        conversations = 1 if args.disable_perspective else args.max_perspective + 1
+        if args.max_thread_num < conversations:
+            logger.warning(
+                "MAX_THREAD_NUM is lower than the number of research conversations; "
+                "some perspectives will be researched serially",
+                extra={
+                    "event": "storm_thread_pool_undersized",
+                    "max_thread_num": args.max_thread_num,
+                    "conversations": conversations
+                }
+            )
+        return args
+
+    def _build_runner_args(self, output_dir: str) -> STORMWikiRunnerArguments:
+        """Build STORM runner arguments for a run writing to output_dir"""
+        return dataclasses.replace(self._runner_args_template, output_dir=output_dir)
+
+    @contextmanager
+    def _checkout_runner(self, output_dir: str) -> Iterator[STORMWikiRunner]:
+        """
+        Borrow a STORM runner from the pool for a single pipeline run.
+
+        A runner keeps per-run state (topic, output directory, timings), so
+        each one serves one run at a time; idle runners are reused instead of
+        rebuilding their modules for every request. The pool grows to the
+        peak number of concurrent runs.
+
+        Args:
+            output_dir: Output directory for this run
+
+        Yields:
+            STORMWikiRunner: Runner configured to write to output_dir
+
+        Example:
+            >>> with self._checkout_runner("/tmp/out") as runner:
+            ...     runner.run(topic="Python", **self._get_pipeline_config())
+        """
+        try:
+            runner = self._runner_pool.get_nowait()
+            runner.args = self._build_runner_args(output_dir)
+        except queue.Empty:
+            runner = STORMWikiRunner(
+                args=self._build_runner_args(output_dir),
+                lm_configs=self.lm_configs,
+                rm=self.retriever
+            )
+        try:
+            yield runner
+        finally:
+            self._runner_pool.put(runner)
+
+    def _cache_key(self, topic: str, pipeline_config: Dict[str, bool]) -> str:
+        """
+        Build the article cache key for a topic.
+
+        Args:
+            topic: Research topic as submitted by the client
+            pipeline_config: Stages the pipeline would run
+
+        Returns:
+            str: SHA-256 hex digest of the normalized topic, pipeline stages
+            and article-generation LM parameters
+        """
+        payload: str = json.dumps(
+            {
+                "topic": normalize_topic(topic),
+                "config": pipeline_config,
+                "lm": self.lm_configs.article_gen_lm.kwargs,
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
     def _get_pipeline_config(self) -> Dict[str, bool]:
         """
         Get pipeline stage configuration.
@@ -415,6 +1020,10 @@ class StormService:
             >>> config = self._get_pipeline_config()
             >>> print(config["do_research"])
         """
+        return self._pipeline_config
+
+    def _load_pipeline_config(self) -> Dict[str, bool]:
+        """Read pipeline stage configuration from the environment"""
         return {
             "do_research": self._get_bool_env("DO_RESEARCH", True),
             "do_generate_outline": self._get_bool_env("DO_GENERATE_OUTLINE", True),
@@ -431,8 +1040,11 @@ class StormService:
         Retrieve the generated article from in-memory storage.
         
         STORM stores articles with paths like:
-            /dev/null/TopicName/polished_article.txt
-            /dev/null/TopicName/storm_gen_article.txt
+            <run dir>/TopicName/storm_gen_article_polished.txt
+            <run dir>/TopicName/storm_gen_article.txt
+
+        Each run reads from its own store, so the only articles found are
+        the ones the current run wrote.
         
         Args:
             config: Pipeline configuration (to check if polishing was enabled)
@@ -443,25 +1055,23 @@ class StormService:
         Raises:
             Exception: If no article file is found in memory
         """
-        # List all files in memory storage
-        all_files = _list_files_in_memory()
-        
-        if not all_files:
+        storage: _MemFS = _storage()
+        if not storage:
             raise Exception("No files were generated in memory storage")
         
         # Try to find polished article first
         if config.get("do_polish_article"):
-            polished_files = [f for f in all_files if "polished_article.txt" in f]
+            polished_files = storage.find("storm_gen_article_polished.txt")
             if polished_files:
-                return _IN_MEMORY_STORAGE[polished_files[0]]
+                return storage[polished_files[0]]
         
         # Fallback to draft article
-        draft_files = [f for f in all_files if "storm_gen_article.txt" in f]
+        draft_files = storage.find("storm_gen_article.txt")
         if draft_files:
-            return _IN_MEMORY_STORAGE[draft_files[0]]
+            return storage[draft_files[0]]
         
         # No article found
-        raise Exception(f"No article file found in memory. Available files: {all_files}")
+        raise Exception(f"No article file found in memory. Available files: {storage.keys()}")
 
     # -------------------------------------------------------------------------
     # Error Handling
@@ -469,21 +1079,31 @@ class StormService:
 
     def _format_error(self, error_type: str, message: str) -> Exception:
         """
-        Format error with traceback for debugging.
+        Format error, with the traceback appended only in debug mode.
+
+        Outside debug mode the traceback is left to the log handler, which
+        only formats it if the record is actually emitted.
 
         Args:
             error_type: Type/category of the error
             message: Error message description
 
         Returns:
-            Exception: Formatted exception with traceback
+            Exception: Formatted exception (with traceback if STORM_DEBUG=1)
 
         Example:
             >>> error = self._format_error("Validation", "Invalid input")
             >>> raise error
         """
-        import traceback
-        full_message: str = f"STORM {error_type}: {message}\nTraceback: {traceback.format_exc()}"
+        full_message: str = f"STORM {error_type}: {message}"
+        if self._debug:
+            full_message += f"\nTraceback: {traceback.format_exc()}"
+        else:
+            logger.error(
+                full_message,
+                exc_info=sys.exc_info()[0] is not None,
+                extra={"event": "storm_pipeline_error", "error_type": error_type}
+            )
         return Exception(full_message)
 
 
@@ -494,6 +1114,9 @@ class StormService:
 def get_memory_storage_size() -> int:
     """
     Get the current size of in-memory storage.
+
+    Counts files in every live store: the process-wide one and those of
+    pipeline runs still in progress.
     
     Returns:
         Number of files currently stored in memory
@@ -502,13 +1125,48 @@ def get_memory_storage_size() -> int:
         >>> from core.storm_service import get_memory_storage_size
         >>> print(f"Files in memory: {get_memory_storage_size()}")
     """
-    return len(_IN_MEMORY_STORAGE)
+    return sum(len(store) for store in _live_stores())
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """
+    Get article cache counters.
+
+    Returns:
+        Dict[str, int]: Cache hits, misses and number of cached articles
+
+    Example:
+        >>> from core.storm_service import get_cache_stats
+        >>> print(get_cache_stats())
+        {'hits': 0, 'misses': 0, 'size': 0}
+    """
+    return _article_cache.stats()
+
+
+def get_memory_bytes() -> int:
+    """
+    Get the approximate size of in-memory storage.
+
+    Covers every live store: the process-wide one and those of pipeline runs
+    still in progress.
+
+    Returns:
+        int: UTF-8 bytes of all stored file paths and contents
+
+    Example:
+        >>> from core.storm_service import get_memory_bytes
+        >>> print(f"Memory storage: {get_memory_bytes()} bytes")
+    """
+    return sum(store.nbytes() for store in _live_stores())
 
 
 def get_memory_storage_files() -> List[str]:
     """
     Get list of all files currently in memory storage.
 
+    Lists files in every live store: the process-wide one and those of
+    pipeline runs still in progress.
+
     Returns:
         List[str]: List of file paths stored in memory
 
@@ -518,4 +1176,4 @@ def get_memory_storage_files() -> List[str]:
         >>> for f in files:
         ...     print(f)
     """
-    return list(_IN_MEMORY_STORAGE.keys())
\ No newline at end of file
+    return [path for store in _live_stores() for path in store.keys()]
\ No newline at end of file
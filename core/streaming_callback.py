@@ -6,26 +6,250 @@ updates from the STORM pipeline. It enables real-time feedback during article
 generation.
 
 Components:
+    - MessageBuffer: Thread-safe FIFO of progress messages with batch draining
+    - StageInfo: Progress counters and current stage of a pipeline run
     - StreamingCallbackHandler: Captures STORM progress for streaming responses
+    - acquire_handler / release_handler: Pool of idle handlers reused across runs
 """
 
+import asyncio
+import dataclasses
 import queue
-from typing import Dict, Any, List, Optional, Generator
+import threading
+from collections import deque
+from typing import Deque, Dict, Any, AsyncGenerator, Callable, List, Optional, Generator, Sequence
 
 from knowledge_storm.storm_wiki.modules.callback import BaseCallbackHandler
 
 
+# Dialogue turn attributes that may hold the question, in order of preference
+_QUESTION_ATTRS = ('conv_q', 'question', 'query')
+_MISSING = object()
+
+# Attribute found to hold the question, per dialogue turn type. Only a
+# handful of turn types exist, so the mapping stays small.
+_question_attr_by_type: Dict[type, str] = {}
+
+# Maximum number of idle handlers kept for reuse
+HANDLER_POOL_SIZE: int = 16
+
+
+class MessageBuffer:
+    """
+    Thread-safe FIFO of progress messages.
+
+    A deque guarded by a single Condition. Unlike queue.Queue, all pending
+    messages can be taken in one critical section, and consumers are woken
+    only when a message is added or the buffer is closed. The put/get/
+    get_nowait/empty methods mirror queue.Queue (raising queue.Empty) so it
+    can be used in its place.
+
+    STORM reports progress from several research threads at once, so puts
+    still take the lock, but the condition is only signalled when a consumer
+    is actually waiting on it. An optional listener is called on every put
+    and on close, for consumers that wait outside the condition (e.g. on an
+    event loop).
+
+    Example:
+        >>> buffer = MessageBuffer()
+        >>> buffer.put("🔍 Starting research...")
+        >>> buffer.drain()
+        ['🔍 Starting research...']
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self._messages: Deque[str] = deque()
+        self._closed: bool = False
+        self._waiters: int = 0
+        self._listener: Optional[Callable[[], None]] = None
+        self._cond: threading.Condition = threading.Condition(threading.Lock())
+
+    def _ready(self) -> bool:
+        return bool(self._messages) or self._closed
+
+    def _wait(self, timeout: Optional[float]) -> None:
+        """Wait for a message or close; the caller must hold the condition."""
+        self._waiters += 1
+        try:
+            self._cond.wait_for(self._ready, timeout)
+        finally:
+            self._waiters -= 1
+
+    def put(self, message: str) -> None:
+        """
+        Append a message and wake any waiting consumer.
+
+        Args:
+            message: Progress message to add
+        """
+        with self._cond:
+            self._messages.append(message)
+            if self._waiters:
+                self._cond.notify()
+            if self._listener is not None:
+                self._listener()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> str:
+        """
+        Remove and return the oldest message.
+
+        Args:
+            block: Whether to wait for a message if the buffer is empty
+            timeout: Maximum seconds to wait when blocking (None waits forever)
+
+        Returns:
+            str: The oldest message
+
+        Raises:
+            queue.Empty: If no message is available
+        """
+        with self._cond:
+            if block and not self._messages:
+                self._wait(timeout)
+            if not self._messages:
+                raise queue.Empty
+            return self._messages.popleft()
+
+    def get_nowait(self) -> str:
+        """
+        Remove and return the oldest message without waiting.
+
+        Returns:
+            str: The oldest message
+
+        Raises:
+            queue.Empty: If the buffer is empty
+        """
+        return self.get(block=False)
+
+    def drain(self, timeout: Optional[float] = 0) -> List[str]:
+        """
+        Remove and return all pending messages.
+
+        Args:
+            timeout: Seconds to wait for a first message if the buffer is
+                empty (0 returns immediately, None waits until a message
+                arrives or the buffer is closed)
+
+        Returns:
+            List[str]: Pending messages in arrival order; empty on timeout,
+            or once the buffer is closed and fully drained
+        """
+        with self._cond:
+            if timeout != 0 and not self._messages:
+                self._wait(timeout)
+            messages: List[str] = list(self._messages)
+            self._messages.clear()
+            return messages
+
+    def close(self) -> None:
+        """
+        Mark the end of the stream and wake all waiting consumers.
+
+        Messages already buffered can still be drained after closing.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            if self._listener is not None:
+                self._listener()
+
+    def reset(self) -> None:
+        """
+        Discard pending messages and reopen the buffer for another run.
+
+        The pending messages are swapped out in one assignment and freed
+        after the lock is released, so producers are never held up by a
+        large clear.
+
+        Example:
+            >>> buffer.close()
+            >>> buffer.reset()
+            >>> buffer.closed
+            False
+        """
+        with self._cond:
+            discarded: Deque[str] = self._messages
+            self._messages = deque()
+            self._closed = False
+        del discarded
+
+    def set_listener(self, listener: Optional[Callable[[], None]]) -> None:
+        """
+        Set a callback invoked whenever a message is added or the buffer closes.
+
+        The listener runs on the producer's thread while the buffer's lock is
+        held, so it must be quick and must not touch the buffer.
+
+        Args:
+            listener: Callback taking no arguments, or None to remove it
+        """
+        with self._cond:
+            self._listener = listener
+
+    @property
+    def closed(self) -> bool:
+        """Return True once close() has been called."""
+        return self._closed
+
+    def empty(self) -> bool:
+        """Return True if no messages are pending."""
+        return not self._messages
+
+    def qsize(self) -> int:
+        """Return the number of pending messages."""
+        return len(self._messages)
+
+
+@dataclasses.dataclass(slots=True)
+class StageInfo:
+    """
+    Progress counters and current stage of a pipeline run.
+
+    Attributes:
+        perspectives_count: Number of research perspectives identified
+        dialogue_turns_count: Number of dialogue turns completed so far
+        current_perspective: Perspective currently being researched
+        current_query: Question asked in the latest dialogue turn
+        topic: Topic being researched
+        perspectives: Identified research perspectives
+
+    Example:
+        >>> info = StageInfo(topic="Python")
+        >>> info.dialogue_turns_count += 1
+    """
+
+    perspectives_count: int = 0
+    dialogue_turns_count: int = 0
+    current_perspective: Optional[str] = None
+    current_query: Optional[str] = None
+    topic: Optional[str] = None
+    perspectives: Sequence[str] = ()
+
+    def reset(self) -> None:
+        """Zero the counters and stage for a new run, keeping the topic."""
+        self.perspectives_count = 0
+        self.dialogue_turns_count = 0
+        self.current_perspective = None
+        self.current_query = None
+        self.perspectives = ()
+
+
 class StreamingCallbackHandler(BaseCallbackHandler):
     """
     Captures STORM pipeline progress for streaming responses.
 
     This handler extends BaseCallbackHandler to capture progress messages
     from various stages of the STORM pipeline and stores them in a thread-safe
-    queue for streaming to clients.
+    buffer for streaming to clients.
 
     Attributes:
-        message_queue: Thread-safe queue storing progress messages
-        _stage_info: Dictionary tracking current pipeline stage information
+        enabled: Whether progress is recorded; a disabled handler ignores
+            every callback without formatting a message
+        message_queue: Thread-safe MessageBuffer storing progress messages
+        _summary_buf: UTF-8 log of every message added since the last clear
+        _stage_info: StageInfo tracking current pipeline stage information
 
     Example:
         >>> handler = StreamingCallbackHandler(topic="Python")
@@ -34,51 +258,43 @@ class StreamingCallbackHandler(BaseCallbackHandler):
         ...     print(message)
     """
 
-    def __init__(self, topic: Optional[str] = None) -> None:
+    def __init__(self, topic: Optional[str] = None, enabled: bool = True) -> None:
         """
         Initialize the streaming callback handler.
 
         Args:
             topic: Optional topic name for context in progress messages
+            enabled: Whether to record progress (False when nobody will read it)
 
         Example:
             >>> handler = StreamingCallbackHandler(topic="Python Programming")
         """
-        self.message_queue: queue.Queue[str] = queue.Queue()
-        self._stage_info: Dict[str, Any] = {
-            "perspectives_count": 0,
-            "dialogue_turns_count": 0,
-            "current_perspective": None,
-            "current_query": None,
-            "topic": topic
-        }
+        self.enabled: bool = enabled
+        self.message_queue: MessageBuffer = MessageBuffer()
+        self._summary_buf: bytearray = bytearray()
+        self._summary_lock: threading.Lock = threading.Lock()
+        self._stage_info: StageInfo = StageInfo(topic=topic)
 
     def clear_progress(self) -> None:
         """
         Clear all accumulated progress messages.
 
-        Resets both the message queue and stage information trackers.
+        Resets the message queue, the summary log and stage information
+        trackers in place. The queue is reopened, so a handler whose previous
+        run closed it can be reused.
 
         Example:
             >>> handler.clear_progress()
             >>> # Queue and stage info are now empty
         """
-        while not self.message_queue.empty():
-            try:
-                self.message_queue.get_nowait()
-            except queue.Empty:
-                break
-        self._stage_info = {
-            "perspectives_count": 0,
-            "dialogue_turns_count": 0,
-            "current_perspective": None,
-            "current_query": None,
-            "topic": self._stage_info.get("topic")
-        }
+        self.message_queue.reset()
+        with self._summary_lock:
+            self._summary_buf.clear()
+        self._stage_info.reset()
 
     def add_progress(self, message: str) -> None:
         """
-        Add a progress message to the queue.
+        Add a progress message to the queue and the summary log.
 
         Args:
             message: Progress message to add
@@ -86,6 +302,12 @@ class StreamingCallbackHandler(BaseCallbackHandler):
         Example:
             >>> handler.add_progress("🔍 Starting research...")
         """
+        if not self.enabled:
+            return
+        with self._summary_lock:
+            if self._summary_buf:
+                self._summary_buf += b"\n"
+            self._summary_buf += message.encode("utf-8")
         self.message_queue.put(message)
 
     def get_progress(self) -> List[str]:
@@ -100,18 +322,90 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             >>> for msg in messages:
             ...     print(msg)
         """
-        messages: List[str] = []
-        while not self.message_queue.empty():
+        return self.message_queue.drain()
+
+    def wait_for_progress(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Wait until progress messages are available and take them all.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            List[str]: Pending progress messages, or an empty list on timeout
+
+        Example:
+            >>> for msg in handler.wait_for_progress(timeout=1.0):
+            ...     print(msg)
+        """
+        return self.message_queue.drain(timeout=timeout)
+
+    def finish(self) -> None:
+        """
+        Signal that the pipeline has finished and no more progress will follow.
+
+        Consumers blocked in wait_for_progress() return once the remaining
+        messages have been taken.
+
+        Example:
+            >>> handler.finish()
+            >>> handler.wait_for_progress()
+            []
+        """
+        self.message_queue.close()
+
+    async def stream(self) -> AsyncGenerator[List[str], None]:
+        """
+        Asynchronously yield batches of progress messages until finish().
+
+        The event loop is woken directly by producers through
+        call_soon_threadsafe, so no thread is parked waiting for progress.
+        Must be consumed on the event loop it was started on.
+
+        Yields:
+            List[str]: Messages that arrived since the previous batch
+
+        Example:
+            >>> async for messages in handler.stream():
+            ...     print("\n".join(messages))
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        wakeup: asyncio.Event = asyncio.Event()
+        buffer: MessageBuffer = self.message_queue
+
+        def wake() -> None:
             try:
-                messages.append(self.message_queue.get_nowait())
-            except queue.Empty:
-                break
-        return messages
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                # The loop has closed; nobody is left to wake
+                pass
+
+        buffer.set_listener(wake)
+        try:
+            while True:
+                wakeup.clear()
+                # Read closed before draining: once closed, nothing more can
+                # be added, so an empty drain means the stream is over
+                closed: bool = buffer.closed
+                messages: List[str] = buffer.drain()
+                if messages:
+                    yield messages
+                elif closed:
+                    break
+                else:
+                    await wakeup.wait()
+        finally:
+            buffer.set_listener(None)
 
     def get_message_generator(self) -> Generator[str, None, None]:
         """
         Generator that yields messages as they are added to the queue.
 
+        Pending messages are taken in batches, one lock acquisition per batch
+        rather than per message. The generator blocks while the pipeline is
+        quiet and ends as soon as finish() has been called and every message
+        has been yielded, so the producer must call finish().
+
         Yields:
             str: Progress messages from the queue
 
@@ -120,11 +414,10 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             ...     print(message)
         """
         while True:
-            try:
-                message: str = self.message_queue.get(timeout=0.1)
-                yield message
-            except queue.Empty:
+            messages: List[str] = self.message_queue.drain(timeout=None)
+            if not messages:
                 break
+            yield from messages
 
     def on_identify_perspective_start(self, **kwargs: Any) -> None:
         """
@@ -137,7 +430,9 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             >>> # Automatically called by STORM pipeline
             >>> handler.on_identify_perspective_start(topic="Python")
         """
-        topic: str = kwargs.get('topic', self._stage_info.get("topic", "the topic"))
+        if not self.enabled:
+            return
+        topic: str = kwargs.get('topic', self._stage_info.topic)
         self.add_progress(f"🔍 Analyzing perspectives for: {topic}")
 
     def on_identify_perspective_end(self, perspectives: List[str], **kwargs: Any) -> None:
@@ -152,13 +447,15 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             >>> # Automatically called by STORM pipeline
             >>> handler.on_identify_perspective_end(perspectives=["History", "Applications"])
         """
-        self._stage_info["perspectives_count"] = len(perspectives)
-        self._stage_info["perspectives"] = perspectives
+        if not self.enabled:
+            return
+        self._stage_info.perspectives_count = len(perspectives)
+        self._stage_info.perspectives = perspectives
 
         if perspectives:
-            self.add_progress(f"📋 Identified {len(perspectives)} perspectives:")
-            for i, perspective in enumerate(perspectives, 1):
-                self.add_progress(f"   {i}. {perspective}")
+            lines: List[str] = [f"📋 Identified {len(perspectives)} perspectives:"]
+            lines.extend(f"   {i}. {perspective}" for i, perspective in enumerate(perspectives, 1))
+            self.add_progress("\n".join(lines))
         else:
             self.add_progress("📋 Using general perspective")
 
@@ -173,8 +470,10 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             >>> # Automatically called by STORM pipeline
             >>> handler.on_information_gathering_start(perspective="History")
         """
-        perspective: str = kwargs.get('perspective', self._stage_info.get("current_perspective", "research"))
-        self._stage_info["current_perspective"] = perspective
+        if not self.enabled:
+            return
+        perspective: str = kwargs.get('perspective', self._stage_info.current_perspective)
+        self._stage_info.current_perspective = perspective
         self.add_progress(f"🔎 Gathering information for: {perspective}")
 
     def on_information_gathering_end(self, **kwargs: Any) -> None:
@@ -188,6 +487,8 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             >>> # Automatically called by STORM pipeline
             >>> handler.on_information_gathering_end(num_queries=5)
         """
+        if not self.enabled:
+            return
         num_queries: int = kwargs.get('num_queries', 0)
         self.add_progress(f"✓ Gathered information from {num_queries} sources")
 
@@ -203,28 +504,55 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             >>> # Automatically called by STORM pipeline
             >>> handler.on_dialogue_turn_end(dlg_turn, perspective="History")
         """
-        self._stage_info["dialogue_turns_count"] += 1
-        turn_num: int = self._stage_info["dialogue_turns_count"]
+        if not self.enabled:
+            return
+        self._stage_info.dialogue_turns_count += 1
+        turn_num: int = self._stage_info.dialogue_turns_count
 
-        question: Any = None
-        for attr in ['conv_q', 'question', 'query']:
-            if hasattr(dlg_turn, attr):
-                question = getattr(dlg_turn, attr)
-                break
+        question: Any = self._get_question(dlg_turn)
 
         if question is None:
             question = str(dlg_turn)
         elif hasattr(question, 'content'):
             question = question.content
 
-        perspective: str = kwargs.get('perspective', self._stage_info.get("current_perspective", "research"))
-        self._stage_info["current_perspective"] = perspective
-        self._stage_info["current_query"] = str(question)
+        perspective: str = kwargs.get('perspective', self._stage_info.current_perspective)
+        self._stage_info.current_perspective = perspective
 
         question_str: str = str(question)
+        self._stage_info.current_query = question_str
         short_question: str = question_str[:80] + "..." if len(question_str) > 80 else question_str
         self.add_progress(f"  💬 Q{turn_num}: {short_question}")
 
+    def _get_question(self, dlg_turn: Any) -> Any:
+        """
+        Return the question carried by a dialogue turn.
+
+        The attribute holding the question is resolved once per dialogue
+        turn type and remembered across handlers, so later turns of the same
+        type take a single getattr. Turn types set their fields per instance,
+        so the attribute is found on the first instance seen rather than on
+        the class.
+
+        Args:
+            dlg_turn: Dialogue turn object
+
+        Returns:
+            Any: The question, or None if no candidate attribute exists
+        """
+        turn_type: type = type(dlg_turn)
+        attr: Optional[str] = _question_attr_by_type.get(turn_type)
+        if attr is not None:
+            question: Any = getattr(dlg_turn, attr, _MISSING)
+            if question is not _MISSING:
+                return question
+        for attr in _QUESTION_ATTRS:
+            question = getattr(dlg_turn, attr, _MISSING)
+            if question is not _MISSING:
+                _question_attr_by_type[turn_type] = attr
+                return question
+        return None
+
     def on_direct_outline_generation_end(self, **kwargs: Any) -> None:
         """
         Called when STORM generates the direct outline.
@@ -236,6 +564,8 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             >>> # Automatically called by STORM pipeline
             >>> handler.on_direct_outline_generation_end()
         """
+        if not self.enabled:
+            return
         self.add_progress("📝 Generating article structure (direct outline)")
 
     def on_outline_refinement_end(self, **kwargs: Any) -> None:
@@ -249,6 +579,8 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             >>> # Automatically called by STORM pipeline
             >>> handler.on_outline_refinement_end()
         """
+        if not self.enabled:
+            return
         self.add_progress("✏️  Refining article structure")
 
     def on_information_organization_start(self, **kwargs: Any) -> None:
@@ -262,6 +594,8 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             >>> # Automatically called by STORM pipeline
             >>> handler.on_information_organization_start()
         """
+        if not self.enabled:
+            return
         self.add_progress("🗂️  Organizing research information")
 
     def get_stage_info(self) -> Dict[str, Any]:
@@ -269,23 +603,84 @@ class StreamingCallbackHandler(BaseCallbackHandler):
         Get information about the current stage.
 
         Returns:
-            Dict[str, Any]: Copy of current stage information dictionary
+            Dict[str, Any]: Copy of current stage information as a dictionary
 
         Example:
             >>> info = handler.get_stage_info()
             >>> print(info["perspectives_count"])
         """
-        return self._stage_info.copy()
+        return dataclasses.asdict(self._stage_info)
 
     def get_summary(self) -> str:
         """
         Get a summary of all progress.
 
+        Messages are appended to a byte buffer as they arrive, so the summary
+        is available even after the queue has been drained for streaming.
+
         Returns:
-            str: Concatenated progress messages
+            str: Newline-joined progress messages since the last clear
 
         Example:
             >>> summary = handler.get_summary()
             >>> print(summary)
         """
-        return "\n".join(self.progress_messages)
\ No newline at end of file
+        with self._summary_lock:
+            return self._summary_buf.decode("utf-8")
+
+
+# Idle handlers, most recently released last
+_idle_handlers: Deque[StreamingCallbackHandler] = deque()
+_idle_handlers_lock: threading.Lock = threading.Lock()
+
+
+def acquire_handler(topic: Optional[str] = None) -> StreamingCallbackHandler:
+    """
+    Take a handler from the idle pool, or build one if the pool is empty.
+
+    A pooled handler is cleared and re-enabled before being returned, so it
+    behaves like a new one.
+
+    Args:
+        topic: Topic name for context in progress messages
+
+    Returns:
+        StreamingCallbackHandler: A handler ready for a new run
+
+    Example:
+        >>> handler = acquire_handler("Python")
+        >>> try:
+        ...     runner.run(topic="Python", callback_handler=handler)
+        ... finally:
+        ...     release_handler(handler)
+    """
+    with _idle_handlers_lock:
+        handler: Optional[StreamingCallbackHandler] = _idle_handlers.pop() if _idle_handlers else None
+    if handler is None:
+        return StreamingCallbackHandler(topic=topic)
+    handler.clear_progress()
+    handler._stage_info.topic = topic
+    handler.enabled = True
+    return handler
+
+
+def release_handler(handler: StreamingCallbackHandler) -> None:
+    """
+    Return a handler to the idle pool once its run is over.
+
+    Only finished handlers are pooled: one whose pipeline may still call it
+    (finish() not yet called) is left to the garbage collector, so a
+    straggling callback can never leak into another run. Handlers beyond
+    HANDLER_POOL_SIZE are dropped as well.
+
+    Args:
+        handler: Handler previously obtained from acquire_handler()
+
+    Example:
+        >>> release_handler(handler)
+    """
+    if not handler.message_queue.closed:
+        return
+    with _idle_handlers_lock:
+        if len(_idle_handlers) < HANDLER_POOL_SIZE:
+            _idle_handlers.append(handler)
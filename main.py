@@ -1,15 +1,17 @@
+import asyncio
 import os
-import time
-from utils.logging_config import setup_logging, get_logger
-from utils.middleware import RequestIDMiddleware, get_request_id
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from utils.logging_config import setup_logging, get_logger, log_event
+from utils.middleware import RequestIDMiddleware
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from api.routes import router
+from api.routes import get_storm_service, router, shutdown_storm_executor, start_storm_executor
+from core.storm_service import close_http_session
 
 load_dotenv()
 
-START_TIME = time.time()
 setup_logging(level="INFO")
 logger = get_logger(__name__)
 
@@ -20,10 +22,25 @@ if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host=HOST, port=PORT, reload=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm up the STORM service on startup and release its worker and connection pools on shutdown."""
+    start_storm_executor()
+    try:
+        # Build the service on the worker thread too: LM/retriever setup is slow
+        await asyncio.to_thread(lambda: get_storm_service().warmup())
+    except Exception:
+        logger.warning("STORM warmup failed; resources will load on first request", exc_info=True)
+    yield
+    # Waits for in-flight pipeline runs, so keep it off the event loop
+    await asyncio.to_thread(shutdown_storm_executor)
+    close_http_session()
+
 app = FastAPI(
     title="STORM API",
     description="FastAPI wrapper for Stanford STORM",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -34,11 +51,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Added last so it wraps CORS and tags preflight responses too
 app.add_middleware(RequestIDMiddleware)
 app.include_router(router)
 
 @app.get("/")
 async def root():
-    request_id = get_request_id()
-    logger.info("Root endpoint accessed", extra={"event": "root_accessed", "request_id": request_id})
+    log_event(logger, "Root endpoint accessed", "root_accessed")
     return {"status": "ok", "message": "STORM API is running"}
\ No newline at end of file
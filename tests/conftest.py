@@ -0,0 +1,46 @@
+"""Shared test fixtures."""
+
+import pytest
+
+
+def write_article(runner, topic, text=None):
+    """Write the article file a real STORM run would leave in its output directory."""
+    from knowledge_storm.utils import FileIOHelper
+
+    FileIOHelper.write_str(
+        f"Article on {topic}" if text is None else text,
+        f"{runner.args.output_dir}/{topic}/storm_gen_article.txt",
+    )
+
+
+@pytest.fixture
+def fake_storm_service(monkeypatch):
+    """
+    Return a factory building a StormService whose STORM runner is faked.
+
+    The factory takes the runner's run behaviour as a callable
+    ``run(runner, topic, **kwargs)`` (defaulting to writing
+    "Article on <topic>") and an optional list that collects every runner
+    constructed. Article polishing is disabled.
+    """
+    import core.storm_service as storm_service
+
+    def make(run=None, runners=None):
+        if run is None:
+            def run(runner, topic, **kwargs):
+                write_article(runner, topic)
+
+        class FakeRunner:
+            def __init__(self, args, **kwargs):
+                self.args = args
+                if runners is not None:
+                    runners.append(self)
+
+            def run(self, topic, **kwargs):
+                return run(self, topic, **kwargs)
+
+        monkeypatch.setattr(storm_service, "STORMWikiRunner", FakeRunner)
+        monkeypatch.setenv("DO_POLISH_ARTICLE", "false")
+        return storm_service.StormService()
+
+    return make
@@ -0,0 +1,84 @@
+"""Test response cache functionality."""
+
+import time
+
+import pytest
+from utils.cache import TTLCache, normalize_topic
+
+
+def test_cache_set_and_get():
+    """Test that a stored value can be read back while fresh."""
+    cache = TTLCache(maxsize=10, ttl=60)
+
+    cache.set("python", "article")
+    entry = cache.get("python")
+
+    assert entry is not None
+    assert entry.value == "article"
+    assert entry.is_fresh()
+
+
+def test_cache_miss_returns_none():
+    """Test that an unknown key returns None."""
+    cache = TTLCache(maxsize=10, ttl=60)
+
+    assert cache.get("missing") is None
+
+
+def test_cache_entry_goes_stale_but_is_kept():
+    """Test that expired entries are still returned for stale fallback."""
+    cache = TTLCache(maxsize=10, ttl=0.01)
+
+    cache.set("python", "article")
+    time.sleep(0.02)
+    entry = cache.get("python")
+
+    assert entry is not None
+    assert not entry.is_fresh()
+    assert entry.remaining_ttl() == 0
+
+
+def test_cache_evicts_least_recently_used():
+    """Test that the least recently used entry is evicted when full."""
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert len(cache) == 2
+
+
+def test_cache_invalidate_and_clear():
+    """Test that entries can be removed individually or all at once."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.set("c", "3")
+
+    assert cache.invalidate("a") is True
+    assert cache.invalidate("a") is False
+    assert cache.clear() == 2
+    assert len(cache) == 0
+
+
+def test_normalize_topic():
+    """Test that topics differing only in case/whitespace share a key."""
+    assert normalize_topic("  Python Programming ") == "python programming"
+    assert normalize_topic("PYTHON programming") == normalize_topic("python Programming")
+
+
+def test_cache_counts_hits_and_misses():
+    """Test that lookups are reflected in the cache stats."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("python", "article")
+
+    cache.get("python")
+    cache.get("python")
+    cache.get("rust")
+
+    assert cache.stats() == {"hits": 2, "misses": 1, "size": 1}
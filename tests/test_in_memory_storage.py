@@ -112,4 +112,114 @@ def test_memory_storage_files_list():
     
     assert len(files) == 2
     assert "test/file1.txt" in files
-    assert "test/file2.txt" in files
\ No newline at end of file
+    assert "test/file2.txt" in files
+
+def test_memory_storage_lists_directory():
+    """Test that listing a directory returns only the files beneath it."""
+    from core.storm_service import _list_files_in_memory
+
+    clear_memory_storage()
+    FileIOHelper.write_str("a", "out/Python/conversation_log.json")
+    FileIOHelper.write_str("b", "out/Python/storm_gen_article.txt")
+    FileIOHelper.write_str("c", "out/Rust/storm_gen_article.txt")
+    FileIOHelper.write_str("d", "out/Python.txt")
+
+    files = _list_files_in_memory("out/Python")
+
+    assert sorted(files) == [
+        "out/Python/conversation_log.json",
+        "out/Python/storm_gen_article.txt",
+    ]
+    assert _list_files_in_memory("missing") == []
+
+
+def test_article_lookup_prefers_polished_article():
+    """Test that the polished article is returned when polishing is enabled."""
+    from core.storm_service import StormService
+
+    clear_memory_storage()
+    FileIOHelper.write_str("Draft", "out/Python/storm_gen_article.txt")
+    FileIOHelper.write_str("Polished", "out/Python/storm_gen_article_polished.txt")
+    service = StormService()
+
+    assert service._get_article_from_memory({"do_polish_article": True}) == "Polished"
+    assert service._get_article_from_memory({"do_polish_article": False}) == "Draft"
+
+
+def test_memory_bytes_and_shared_segments():
+    """Test that storage size is reported and repeated path segments are shared."""
+    from core.storm_service import _IN_MEMORY_STORAGE, get_memory_bytes
+
+    clear_memory_storage()
+    FileIOHelper.write_str("abc", "".join(["/tmp/out/", "Python/conversation_log.json"]))
+    FileIOHelper.write_str("é", "".join(["/tmp/out/", "Rust/conversation_log.json"]))
+
+    python_dir = _IN_MEMORY_STORAGE._node("/tmp/out/Python")
+    rust_dir = _IN_MEMORY_STORAGE._node("/tmp/out/Rust")
+    python_name = next(key for key in python_dir if key is not None)
+    rust_name = next(key for key in rust_dir if key is not None)
+
+    assert python_name is rust_name
+    assert sorted(get_memory_storage_files()) == [
+        "/tmp/out/Python/conversation_log.json",
+        "/tmp/out/Rust/conversation_log.json",
+    ]
+    assert get_memory_bytes() == len("/tmp/out/Python/conversation_log.json") + 3 + len(
+        "/tmp/out/Rust/conversation_log.json"
+    ) + 2
+
+
+def test_memory_storage_read_does_not_copy():
+    """Test that reading a file returns the stored string without copying it."""
+    clear_memory_storage()
+    article = "".join(["Polished article ", "body"])
+
+    FileIOHelper.write_str(article, "out/Python/storm_gen_article_polished.txt")
+
+    assert FileIOHelper.read_str("out/Python/storm_gen_article_polished.txt") is article
+
+
+def test_memory_helpers_include_runs_in_progress():
+    """Test that the public helpers report files held by a run's private store."""
+    import threading
+    from core.storm_service import _MemFS, _STORAGE_CTX, get_memory_bytes
+
+    clear_memory_storage()
+    written = threading.Event()
+    release = threading.Event()
+
+    def run():
+        token = _STORAGE_CTX.set(_MemFS())
+        try:
+            FileIOHelper.write_str("abc", "/scratch/run1/Python/storm_gen_article.txt")
+            written.set()
+            release.wait(timeout=5)
+        finally:
+            _STORAGE_CTX.reset(token)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    try:
+        assert written.wait(timeout=5)
+        assert get_memory_storage_size() == 1
+        assert get_memory_storage_files() == ["/scratch/run1/Python/storm_gen_article.txt"]
+        assert get_memory_bytes() == len("/scratch/run1/Python/storm_gen_article.txt") + 3
+    finally:
+        release.set()
+        worker.join()
+
+    assert get_memory_storage_size() == 0
+
+
+def test_windows_paths_are_normalized():
+    """Test that backslash paths are stored and found under forward-slash keys."""
+    from core.storm_service import _normalize_path
+
+    posix_path = "topic/storm_gen_article.txt"
+    assert _normalize_path(posix_path) is posix_path
+
+    clear_memory_storage()
+    FileIOHelper.write_str("article", "topic\\storm_gen_article.txt")
+
+    assert get_memory_storage_files() == [posix_path]
+    assert FileIOHelper.read_str("topic\\storm_gen_article.txt") == "article"
@@ -62,10 +62,10 @@ def test_health_response_headers():
     assert response.status_code == 200
     assert "X-Request-ID" in response.headers
     
-    # Request ID should be a UUID format (36 chars)
+    # Request ID should be a UUID in hex format (32 chars)
     request_id = response.headers["X-Request-ID"]
-    assert len(request_id) == 36
-    assert "-" in request_id
+    assert len(request_id) == 32
+    assert "-" not in request_id
 
 
 @pytest.mark.slow
@@ -130,7 +130,7 @@ def test_request_id_in_headers():
     request_id = response.headers["X-POST-request-id"] if "X-POST-request-id" in response.headers else response.headers.get("X-Request-ID")
     
     assert request_id is not None
-    assert len(request_id) == 36  # UUID format
+    assert len(request_id) == 32  # UUID hex format
 
 
 @pytest.mark.integration
@@ -196,13 +196,28 @@ def test_concurrent_requests_health():
     def make_request():
         return client.get("/health")
     
+    request_ids = set()
     with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
         futures = [executor.submit(make_request) for _ in range(5)]
-        results = [f.result() for f in concurrent.futures.as_completed(futures)]
-    
-    # All requests should succeed
-    assert all(r.status_code == 200 for r in results)
-    
-    # All request IDs should be different
-    request_ids = [r.headers["X-Request-ID"] for r in results]
-    assert len(request_ids) == len(set(request_ids))  # All unique
\ No newline at end of file
+        for future in concurrent.futures.as_completed(futures):
+            response = future.result()
+
+            # Every request should succeed with a request ID not seen before
+            assert response.status_code == 200
+            request_id = response.headers["X-Request-ID"]
+            assert request_id not in request_ids
+            request_ids.add(request_id)
+
+    assert len(request_ids) == 5
+
+
+@pytest.mark.integration
+def test_cors_preflight_has_request_id():
+    """Test that CORS preflight responses also carry a request ID."""
+    response = client.options(
+        "/query",
+        headers={"Origin": "http://example.com", "Access-Control-Request-Method": "POST"}
+    )
+
+    assert response.status_code == 200
+    assert "X-Request-ID" in response.headers
@@ -0,0 +1,336 @@
+"""Test structured JSON logging configuration."""
+
+import json
+import logging
+
+from utils.logging_config import JSONFormatter
+
+
+def _record(msg="Test message", **extra):
+    record = logging.LogRecord(
+        name="test", level=logging.INFO, pathname="test.py",
+        lineno=1, msg=msg, args=(), exc_info=None
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_outputs_message_level_and_utc_timestamp():
+    """Test that records are formatted as JSON with an ISO-8601 UTC timestamp."""
+    from datetime import datetime
+
+    entry = json.loads(JSONFormatter().format(_record()))
+
+    assert entry["level"] == "INFO"
+    assert entry["message"] == "Test message"
+    assert entry["timestamp"].endswith("Z")
+    datetime.fromisoformat(entry["timestamp"].replace("Z", "+00:00"))
+
+
+def test_json_formatter_includes_extra_fields():
+    """Test that extra fields are included and non-JSON values are stringified."""
+    class Topic:
+        def __str__(self):
+            return "Python"
+
+    entry = json.loads(JSONFormatter().format(_record(event="query_received", topic=Topic())))
+
+    assert entry["event"] == "query_received"
+    assert entry["topic"] == "Python"
+    assert "msg" not in entry
+
+
+def test_setup_logging_writes_from_listener_thread(monkeypatch):
+    """Test that records are enqueued by the caller and written as JSON by the listener."""
+    import io
+    import threading
+    import utils.logging_config as logging_config
+
+    stream = io.StringIO()
+    writers = []
+
+    class RecordingStream:
+        def write(self, text):
+            writers.append(threading.current_thread())
+            stream.write(text)
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(logging_config.sys, "stdout", RecordingStream())
+    root = logging.getLogger()
+    saved = root.handlers[:], root.level
+    try:
+        logging_config.setup_logging(level="INFO")
+        items = ["a"]
+        logging.getLogger("test.listener").info("items: %s", items, extra={"event": "listed"})
+        items.append("b")
+        logging_config._stop_listener()
+    finally:
+        root.handlers[:], level = saved
+        root.setLevel(level)
+
+    entry = json.loads(stream.getvalue())
+    assert entry["message"] == "items: ['a']"
+    assert entry["event"] == "listed"
+    assert threading.current_thread() not in writers
+
+
+class _CountingStream:
+    """Text stream that records writes and counts flushes."""
+
+    def __init__(self):
+        self.writes = []
+        self.flushes = 0
+
+    def write(self, text):
+        self.writes.append(text)
+
+    def flush(self):
+        self.flushes += 1
+
+
+def test_listener_flushes_once_per_batch():
+    """Test that records queued together are written and then flushed once."""
+    import queue
+    from utils.logging_config import _BatchingQueueListener, _BufferedStreamHandler
+
+    stream = _CountingStream()
+    handler = _BufferedStreamHandler(stream)
+    handler.setFormatter(JSONFormatter())
+    log_queue = queue.SimpleQueue()
+    for i in range(5):
+        log_queue.put(_record(str(i)))
+    listener = _BatchingQueueListener(log_queue, handler, max_batch=3, max_delay=5.0)
+
+    listener.start()
+    listener.stop()
+
+    assert [json.loads(line)["message"] for line in stream.writes] == ["0", "1", "2", "3", "4"]
+    assert stream.flushes == 2
+
+
+def test_listener_flushes_a_lone_record_after_max_delay():
+    """Test that a single record is not held back longer than max_delay."""
+    import queue
+    import time
+    from utils.logging_config import _BatchingQueueListener, _BufferedStreamHandler
+
+    stream = _CountingStream()
+    handler = _BufferedStreamHandler(stream)
+    handler.setFormatter(JSONFormatter())
+    log_queue = queue.SimpleQueue()
+    listener = _BatchingQueueListener(log_queue, handler, max_batch=512, max_delay=0.01)
+
+    listener.start()
+    try:
+        log_queue.put(_record("alone"))
+        deadline = time.monotonic() + 2
+        while not stream.flushes and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert stream.flushes == 1
+        assert len(stream.writes) == 1
+    finally:
+        listener.stop()
+
+
+def test_timestamp_comes_from_record_creation_time():
+    """Test that the timestamp reflects when the record was made, not when it was formatted."""
+    record = _record()
+    record.created = 1704110400.25
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["timestamp"] == "2024-01-01T12:00:00.250000Z"
+
+
+def test_log_event_tags_event_and_skips_disabled_levels(caplog):
+    """Test that structured events carry their fields and disabled levels build no record."""
+    from utils.logging_config import log_event
+
+    logger = logging.getLogger("test.events")
+    with caplog.at_level(logging.INFO, logger="test.events"):
+        log_event(logger, "Quiet", "quiet", level=logging.DEBUG)
+        log_event(logger, "Cache cleared", "cache_invalidated", cleared=2)
+
+    assert [r.getMessage() for r in caplog.records] == ["Cache cleared"]
+    record = caplog.records[0]
+    assert record.event == "cache_invalidated"
+    assert record.cleared == 2
+
+
+def test_get_logger_resolves_each_name_once(monkeypatch):
+    """Test that repeated get_logger calls for a name reuse the cached logger."""
+    from utils.logging_config import get_logger
+
+    first = get_logger("test.cached")
+    real_get_logger = logging.getLogger
+
+    def guarded(name=None):
+        if name == "test.cached":
+            raise AssertionError("logging.getLogger called for a cached name")
+        return real_get_logger(name)
+
+    monkeypatch.setattr(logging, "getLogger", guarded)
+
+    assert get_logger("test.cached") is first
+    assert first.name == "test.cached"
+
+
+def test_request_id_filter_stamps_current_request_id():
+    """Test that records get the request ID from context unless one was passed explicitly."""
+    from utils.logging_config import RequestIDFilter
+    from utils.middleware import request_id_context
+
+    request_filter = RequestIDFilter()
+    token = request_id_context.set("abc123")
+    try:
+        tagged = _record()
+        explicit = _record(request_id="upstream")
+        assert request_filter.filter(tagged) and request_filter.filter(explicit)
+    finally:
+        request_id_context.reset(token)
+
+    assert tagged.request_id == "abc123"
+    assert explicit.request_id == "upstream"
+    assert json.loads(JSONFormatter().format(tagged))["request_id"] == "abc123"
+
+
+def test_sampling_filter_keeps_one_in_n_below_warning():
+    """Test that INFO records are sampled while warnings always pass."""
+    from utils.logging_config import SamplingFilter
+
+    sampler = SamplingFilter(rate=3)
+    kept = [sampler.filter(_record(str(i))) for i in range(9)]
+    warning = _record("careful")
+    warning.levelno = logging.WARNING
+
+    assert kept.count(True) == 3
+    assert all(sampler.filter(warning) for _ in range(5))
+
+
+def test_setup_logging_sample_rate_from_environment(monkeypatch):
+    """Test that LOG_SAMPLE_RATE adds a sampling filter to the root handler."""
+    import utils.logging_config as logging_config
+    from utils.logging_config import SamplingFilter
+
+    monkeypatch.setenv("LOG_SAMPLE_RATE", "10")
+    root = logging.getLogger()
+    saved = root.handlers[:], root.level
+    try:
+        logging_config.setup_logging(level="INFO")
+        filters = root.handlers[0].filters
+    finally:
+        logging_config._stop_listener()
+        root.handlers[:], level = saved
+        root.setLevel(level)
+
+    samplers = [f for f in filters if isinstance(f, SamplingFilter)]
+    assert [s.rate for s in samplers] == [10]
+
+
+def test_logging_shares_the_middleware_request_id_context():
+    """Test that log records read the same ContextVar the middleware writes."""
+    import utils.logging_config as logging_config
+    import utils.middleware as middleware
+
+    assert logging_config.REQUEST_ID_VAR is middleware.request_id_context
+    assert middleware.REQUEST_ID_VAR is middleware.request_id_context
+
+
+def test_message_formatting_with_and_without_args():
+    """Test that plain messages pass through and %-args or non-str messages are rendered."""
+    formatter = JSONFormatter()
+    with_args = _record("items: %s")
+    with_args.args = (["a"],)
+    literal_percent = _record("100% done")
+
+    assert json.loads(formatter.format(with_args))["message"] == "items: ['a']"
+    assert json.loads(formatter.format(literal_percent))["message"] == "100% done"
+    assert json.loads(formatter.format(_record(ValueError("bad"))))["message"] == "bad"
+
+
+def test_record_without_extras_has_only_base_fields():
+    """Test that a plain record produces no extra keys, even after another formatter set 'message'."""
+    record = _record()
+    logging.Formatter().format(record)
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert set(entry) == {"level", "timestamp", "message"}
+
+
+def test_timestamps_keep_microseconds_and_round_into_the_next_second():
+    """Test that records in a burst get distinct timestamps, rounded like datetime."""
+    formatter = JSONFormatter()
+    stamps = []
+    for created in (1704110400.000001, 1704110400.000002, 1704110400.9999996):
+        record = _record()
+        record.created = created
+        stamps.append(json.loads(formatter.format(record))["timestamp"])
+
+    assert stamps == [
+        "2024-01-01T12:00:00.000001Z",
+        "2024-01-01T12:00:00.000002Z",
+        "2024-01-01T12:00:01Z",
+    ]
+
+
+def test_handler_writes_each_record_in_one_call():
+    """Test that a record and its newline reach the stream as a single write, unflushed."""
+    from utils.logging_config import _BufferedStreamHandler
+
+    stream = _CountingStream()
+    handler = _BufferedStreamHandler(stream)
+    handler.setFormatter(JSONFormatter())
+
+    handler.handle(_record("one"))
+    handler.handle(_record("two"))
+
+    assert len(stream.writes) == 2
+    assert all(text.endswith("}\n") and text.count("\n") == 1 for text in stream.writes)
+    assert stream.flushes == 0
+
+
+def test_extra_fields_keep_the_order_they_were_added():
+    """Test that extras are emitted in insertion order after the base fields."""
+    record = _record(event="query_received", topic="Python", request_id="abc")
+    logging.Formatter().format(record)
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert list(entry) == ["level", "timestamp", "message", "event", "topic", "request_id"]
+
+
+def test_get_logger_merges_static_fields_into_one_filter(caplog):
+    """Test that later calls with different or reordered fields update the logger's single filter."""
+    from utils.logging_config import StaticFieldsFilter, get_logger
+
+    logger = get_logger("test.static_merge", service="a", env="test")
+    assert get_logger("test.static_merge", env="test", service="a") is logger
+    get_logger("test.static_merge", service="b", tags=["x"])
+
+    assert len([f for f in logger.filters if isinstance(f, StaticFieldsFilter)]) == 1
+    with caplog.at_level(logging.INFO, logger="test.static_merge"):
+        logger.info("merged")
+
+    record = caplog.records[0]
+    assert (record.service, record.env, record.tags) == ("b", "test", ["x"])
+
+
+def test_get_logger_static_fields_are_added_to_records(caplog):
+    """Test that static fields are stamped once per logger and yield to explicit extras."""
+    from utils.logging_config import StaticFieldsFilter, get_logger
+
+    logger = get_logger("test.static", service="storm-api", env="test")
+    assert get_logger("test.static", service="storm-api", env="test") is logger
+    assert len([f for f in logger.filters if isinstance(f, StaticFieldsFilter)]) == 1
+
+    with caplog.at_level(logging.INFO, logger="test.static"):
+        logger.info("started")
+        logger.info("overridden", extra={"env": "prod"})
+
+    first, second = caplog.records
+    assert (first.service, first.env) == ("storm-api", "test")
+    assert (second.service, second.env) == ("storm-api", "prod")
+    assert json.loads(JSONFormatter().format(first))["service"] == "storm-api"
@@ -0,0 +1,77 @@
+"""Test request validation models."""
+
+import pytest
+from pydantic import ValidationError
+from api.models import StormRequest
+
+
+def test_valid_topic():
+    """Test that a normal topic is accepted."""
+    req = StormRequest(topic="Python Programming")
+
+    assert req.topic == "Python Programming"
+    assert req.stream is False
+
+
+def test_topic_is_stripped():
+    """Test that surrounding whitespace is removed from the topic."""
+    req = StormRequest(topic="   Python   ")
+
+    assert req.topic == "Python"
+
+
+def test_topic_too_short():
+    """Test that topics shorter than 3 characters are rejected."""
+    with pytest.raises(ValidationError):
+        StormRequest(topic="ab")
+
+
+def test_topic_too_long():
+    """Test that topics longer than 200 characters are rejected."""
+    with pytest.raises(ValidationError):
+        StormRequest(topic="a" * 201)
+
+
+def test_whitespace_only_topic():
+    """Test that a whitespace-only or empty topic is rejected with the blank-topic error."""
+    for topic in ("     ", ""):
+        with pytest.raises(ValidationError) as exc_info:
+            StormRequest(topic=topic)
+
+        assert "Topic cannot be empty or whitespace" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("topic", [
+    "<script>alert(1)</script>",
+    "JavaScript:alert(1)",
+    "see http://example.com",
+    "see HTTPS://example.com",
+])
+def test_forbidden_patterns_rejected(topic):
+    """Test that forbidden patterns are rejected regardless of case."""
+    with pytest.raises(ValidationError) as exc_info:
+        StormRequest(topic=topic)
+
+    assert "forbidden pattern" in str(exc_info.value)
+
+
+def test_unknown_fields_rejected():
+    """Test that unexpected request fields are rejected."""
+    with pytest.raises(ValidationError):
+        StormRequest(topic="Python", unexpected=True)
+
+
+def test_request_is_immutable():
+    """Test that a validated request cannot be mutated."""
+    req = StormRequest(topic="Python")
+
+    with pytest.raises(ValidationError):
+        req.topic = "Rust"
+
+
+def test_forbidden_pattern_reported_lowercase():
+    """Test that the matched pattern is reported in its canonical form."""
+    with pytest.raises(ValidationError) as exc_info:
+        StormRequest(topic="see HTTPS://example.com")
+
+    assert "forbidden pattern: https://" in str(exc_info.value)
\ No newline at end of file
@@ -14,8 +14,8 @@ def test_generate_request_id():
     assert id1 is not None
     assert id2 is not None
     assert id1 != id2  # Each ID should be unique
-    assert len(id1) == 36  # UUID format (32 chars + 4 dashes)
-    assert "-" in id1  # UUID format has dashes
+    assert len(id1) == 32  # 128 bits as hex
+    assert "-" not in id1
 
 
 def test_get_request_id_empty():
@@ -37,7 +37,7 @@ def test_middleware_generates_request_id():
     request_id = generate_request_id()
     
     assert request_id is not None
-    assert len(request_id) == 36
+    assert len(request_id) == 32
 
 
 def test_middleware_adds_request_id_to_response_headers():
@@ -56,7 +56,7 @@ def test_middleware_adds_request_id_to_response_headers():
     response.headers["X-Request-ID"] = request_id
     
     assert "X-Request-ID" in response.headers
-    assert len(response.headers["X-Request-ID"]) == 36
+    assert len(response.headers["X-Request-ID"]) == 32
 
 
 def test_request_id_is_unique_per_request():
@@ -71,25 +71,13 @@ def test_request_id_is_unique_per_request():
 
 
 def test_request_id_format():
-    """Test that request ID follows UUID format."""
+    """Test that request ID is 128 random bits in hex form."""
     request_id = generate_request_id()
-    
-    # UUID format: 8-4-4-4-12 hexadecimal characters
-    parts = request_id.split("-")
-    
-    assert len(parts) == 5
-    assert len(parts[0]) == 8
-    assert len(parts[1]) == 4
-    assert len(parts[2]) == 4
-    assert len(parts[3]) == 4
-    assert len(parts[4]) == 12
-    
-    # All parts should be hexadecimal
-    for part in parts:
-        try:
-            int(part, 16)
-        except ValueError:
-            assert False, f"Part '{part}' is not hexadecimal"
+
+    # 32 lowercase hexadecimal characters, no dashes
+    assert len(request_id) == 32
+    assert request_id == request_id.lower()
+    assert bytes.fromhex(request_id).hex() == request_id
 
 
 def test_request_id_context_isolation():
@@ -121,10 +109,12 @@ def test_middleware_initialization():
     class MockApp:
         pass
     
-    middleware = RequestIDMiddleware(MockApp())
+    app = MockApp()
+    middleware = RequestIDMiddleware(app)
     
     assert middleware is not None
-    assert hasattr(middleware, 'dispatch')
+    assert middleware.app is app
+    assert callable(middleware)
 
 
 def test_request_id_persistence_in_context():
@@ -157,7 +147,105 @@ def test_multiple_sequential_requests():
     # All IDs should be unique
     assert len(request_ids) == len(set(request_ids))
     
-    # IDs should not follow a predictable pattern (UUID4 is random)
+    # IDs should not follow a predictable pattern (they are random)
     # Just verify they're all different
     assert request_ids[0] != request_ids[1]
-    assert request_ids[5] != request_ids[9]
\ No newline at end of file
+    assert request_ids[5] != request_ids[9]
+
+async def test_middleware_sets_header_and_context_for_asgi_app():
+    """Test that the ASGI middleware tags the response and exposes the ID to the app."""
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["context"] = get_request_id()
+        seen["state"] = scope["state"]["request_id"]
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    await RequestIDMiddleware(app)({"type": "http", "headers": []}, None, send)
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"x-request-id"].decode() == seen["context"] == seen["state"]
+    assert sent[1]["body"] == b"ok"
+    assert get_request_id() == ""
+
+
+async def test_middleware_passes_non_http_scopes_through():
+    """Test that lifespan and websocket scopes reach the app untouched."""
+    received = []
+
+    async def app(scope, receive, send):
+        received.append((scope, send, get_request_id()))
+
+    async def send(message):
+        pass
+
+    scope = {"type": "lifespan"}
+    await RequestIDMiddleware(app)(scope, None, send)
+
+    assert received == [(scope, send, "")]
+    assert "state" not in scope
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (b"abc-123_DEF.4", "abc-123_DEF.4"),
+        (b"a" * 64, "a" * 64),
+        (b"a" * 65, None),
+        (b"", None),
+        (b"bad id", None),
+        (b"bad\r\nSet-Cookie: x", None),
+    ],
+)
+def test_incoming_request_id_validation(header, expected):
+    """Test that only short, safe client request IDs are accepted."""
+    from utils.middleware import incoming_request_id
+
+    scope = {"type": "http", "headers": [(b"accept", b"*/*"), (b"x-request-id", header)]}
+
+    assert incoming_request_id(scope) == expected
+
+
+async def test_middleware_reuses_client_request_id():
+    """Test that a valid incoming X-Request-ID is propagated instead of replaced."""
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["context"] = get_request_id()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "headers": [(b"x-request-id", b"upstream-42")]}
+    await RequestIDMiddleware(app)(scope, None, send)
+
+    assert seen["context"] == "upstream-42"
+    assert dict(sent[0]["headers"])[b"x-request-id"] == b"upstream-42"
+
+
+async def test_middleware_does_not_mutate_response_headers():
+    """Test that the request ID header is added to a copy of the header list."""
+    raw_headers = [(b"content-type", b"text/plain")]
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": raw_headers})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    await RequestIDMiddleware(app)({"type": "http", "headers": []}, None, send)
+
+    assert raw_headers == [(b"content-type", b"text/plain")]
+    assert sent[0]["headers"][0] == (b"content-type", b"text/plain")
+    assert sent[0]["headers"][1][0] == b"x-request-id"
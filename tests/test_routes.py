@@ -0,0 +1,440 @@
+"""Test API route helpers."""
+
+import asyncio
+import threading
+
+import time
+
+import pytest
+from api.routes import buffer_stream, run_single_flight, stream_article_generator
+from tests.conftest import write_article
+from utils.cache import CacheEntry
+
+
+class FakeStreamingService:
+    """Minimal stand-in for StormService that yields canned chunks."""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+
+    async def stream(self, topic, executor=None):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+
+async def test_stream_generator_yields_all_chunks():
+    """Test that every chunk from the service reaches the client in order."""
+    service = FakeStreamingService(["one\n", "two\n", "three\n"])
+
+    chunks = [chunk async for chunk in stream_article_generator("Python", service)]
+
+    assert chunks == [b"one\n", b"two\n", b"three\n"]
+
+
+async def test_stream_generator_yields_before_pipeline_finishes():
+    """Test that the first chunk is delivered while the pipeline is still running."""
+    release = asyncio.Event()
+
+    class BlockingService:
+        async def stream(self, topic, executor=None):
+            yield "first\n"
+            await release.wait()
+            yield "second\n"
+
+    stream = stream_article_generator("Python", BlockingService())
+
+    first = await stream.__anext__()
+    assert first == b"first\n"
+    assert not release.is_set()
+
+    release.set()
+    rest = [chunk async for chunk in stream]
+    assert rest == [b"second\n"]
+
+
+async def test_stream_generator_reports_errors():
+    """Test that a pipeline failure is surfaced as an error chunk."""
+    service = FakeStreamingService(["partial\n"], error=RuntimeError("boom"))
+
+    chunks = [chunk async for chunk in stream_article_generator("Python", service)]
+
+    assert chunks[0] == b"partial\n"
+    assert chunks[-1] == "❌ Error: boom\n".encode("utf-8")
+
+
+class CountingRun:
+    """Fake STORM run behaviour that counts runs and fails while error is set."""
+
+    def __init__(self):
+        self.calls = 0
+        self.error = None
+
+    def __call__(self, runner, topic, **kwargs):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        write_article(runner, topic, f"Generated article: {topic}")
+
+
+class SlowRefreshService:
+    """Minimal stand-in for StormService whose article refreshes block until released."""
+
+    def __init__(self, release):
+        self.release = release
+        self.calls = 0
+
+    def refresh_article(self, topic):
+        self.release.wait(timeout=5)
+        self.calls += 1
+        now = time.monotonic()
+        return CacheEntry(generated_at=now, stale_at=now + 60, value=f"Generated article: {topic}")
+
+
+@pytest.fixture
+def client_with_service(fake_storm_service, monkeypatch):
+    """Yield a test client backed by a StormService with a faked runner and an empty article cache."""
+    from fastapi.testclient import TestClient
+    import core.storm_service as storm_service
+    from api.routes import get_existing_storm_service, get_storm_service
+    from main import app
+
+    monkeypatch.setattr(storm_service, "_article_cache", storm_service.TTLCache(maxsize=10, ttl=60))
+    run = CountingRun()
+    service = fake_storm_service(run)
+    app.dependency_overrides[get_storm_service] = lambda: service
+    app.dependency_overrides[get_existing_storm_service] = lambda: service
+    try:
+        yield TestClient(app), service, run
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_query_caches_result_by_normalized_topic(client_with_service):
+    """Test that repeated topics are served from cache without re-running."""
+    client, service, run = client_with_service
+
+    first = client.post("/query", json={"topic": "Python", "stream": False})
+    second = client.post("/query", json={"topic": "  python ", "stream": False})
+
+    assert first.status_code == 200
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.status_code == 200
+    assert second.headers["X-Cache"] == "HIT"
+    assert "max-age=" in second.headers["Cache-Control"]
+    assert second.json() == first.json()
+    assert run.calls == 1
+
+
+def test_query_serves_stale_on_failure(client_with_service):
+    """Test that a stale article is returned when regeneration fails."""
+    import core.storm_service as storm_service
+
+    client, service, run = client_with_service
+    storm_service._article_cache.ttl = 0
+    client.post("/query", json={"topic": "Python", "stream": False})
+    run.error = RuntimeError("rate limited")
+
+    response = client.post("/query", json={"topic": "Python", "stream": False})
+
+    assert response.status_code == 200
+    assert response.headers["X-Cache"] == "STALE"
+    assert response.json()["result"] == "Generated article: Python"
+
+
+def test_query_failure_without_cache_returns_500(client_with_service):
+    """Test that a failure with nothing cached is reported as a 500."""
+    client, service, run = client_with_service
+    run.error = RuntimeError("rate limited")
+
+    response = client.post("/query", json={"topic": "Python", "stream": False})
+
+    assert response.status_code == 500
+    assert "rate limited" in response.json()["detail"]
+
+
+def test_clear_cache_endpoint(client_with_service):
+    """Test that the cache can be invalidated per topic or entirely."""
+    client, service, run = client_with_service
+    client.post("/query", json={"topic": "Python", "stream": False})
+    client.post("/query", json={"topic": "Rust", "stream": False})
+
+    single = client.delete("/cache", params={"topic": "PYTHON"})
+    remaining = client.delete("/cache")
+
+    assert single.json() == {"cleared": 1}
+    assert remaining.json() == {"cleared": 1}
+
+
+def test_clear_cache_regenerates_query_and_stream_articles(client_with_service):
+    """Test that invalidating a topic makes both /query and /query/stream regenerate it."""
+    client, service, run = client_with_service
+
+    query = client.post("/query", json={"topic": "Python", "stream": False})
+    stream = client.post("/query/stream", json={"topic": "Python"})
+    cleared = client.delete("/cache", params={"topic": "Python"})
+    requery = client.post("/query", json={"topic": "Python", "stream": False})
+    restream = client.post("/query/stream", json={"topic": "Python"})
+
+    assert stream.text.endswith(query.json()["result"])
+    assert run.calls == 2
+    assert cleared.json() == {"cleared": 1}
+    assert requery.headers["X-Cache"] == "MISS"
+    assert restream.text.endswith(requery.json()["result"])
+
+
+def test_unbuilt_service_is_never_constructed_by_health_or_cache_clear(monkeypatch):
+    """Test that /health and DELETE /cache work without building the STORM service."""
+    from fastapi.testclient import TestClient
+    import api.routes
+    from main import app
+
+    def fail():
+        raise ValueError("DEEPSEEK_API_KEY not set")
+
+    monkeypatch.setattr(api.routes, "_storm_service", None)
+    monkeypatch.setattr(api.routes, "StormService", fail)
+    monkeypatch.setattr(api.routes, "_last_health", None)
+    client = TestClient(app)
+
+    health = client.get("/health")
+    cleared = client.delete("/cache")
+
+    assert health.json()["status"] == "unhealthy"
+    assert cleared.status_code == 200
+    assert api.routes._storm_service is None
+
+
+def test_health_response_is_cached():
+    """Test that back-to-back health probes reuse the same response."""
+    from fastapi.testclient import TestClient
+    import api.routes
+    from main import app
+
+    client = TestClient(app)
+    api.routes._last_health = None
+
+    first = client.get("/health")
+    second = client.get("/health")
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+
+
+def test_health_serves_stale_on_failure(monkeypatch):
+    """Test that the last good health response is served if a refresh fails."""
+    from fastapi.testclient import TestClient
+    import api.routes
+    from main import app
+
+    client = TestClient(app)
+    api.routes._last_health = None
+    first = client.get("/health")
+
+    def failing_check():
+        raise RuntimeError("probe failed")
+
+    monkeypatch.setattr(api.routes, "HEALTH_CACHE_TTL", 0.0)
+    monkeypatch.setattr(api.routes, "check_environment", failing_check)
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.headers["X-Cache"] == "STALE"
+    assert response.json() == first.json()
+
+
+def test_json_routes_send_compact_orjson_bytes(client_with_service):
+    """Test that JSON endpoints send orjson-encoded bodies as application/json."""
+    import orjson
+
+    client, service, run = client_with_service
+
+    responses = [
+        client.get("/health"),
+        client.post("/query", json={"topic": "Python", "stream": False}),
+        client.delete("/cache"),
+    ]
+
+    for response in responses:
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == orjson.dumps(orjson.loads(response.content))
+
+
+async def _chunks(*items, delay=0.0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+async def test_buffer_stream_coalesces_small_chunks():
+    """Test that chunks arriving together are sent as a single write."""
+    out = [chunk async for chunk in buffer_stream(_chunks("a", "b", "c"), size=1024, max_delay=1.0)]
+
+    assert out == [b"abc"]
+
+
+async def test_buffer_stream_flushes_at_size():
+    """Test that the buffer is flushed once it reaches the size threshold."""
+    out = [chunk async for chunk in buffer_stream(_chunks("aaaa", "bbbb", "c"), size=8, max_delay=1.0)]
+
+    assert out == [b"aaaabbbb", b"c"]
+
+
+async def test_buffer_stream_flushes_after_delay():
+    """Test that a slow stream is not held back longer than max_delay."""
+    out = [chunk async for chunk in buffer_stream(_chunks("a", "b", delay=0.05), size=1024, max_delay=0.01)]
+
+    assert out == [b"a", b"b"]
+
+
+async def test_buffer_stream_encodes_utf8():
+    """Test that text chunks are encoded as UTF-8."""
+    out = [chunk async for chunk in buffer_stream(_chunks("✅ done"), size=1024, max_delay=1.0)]
+
+    assert b"".join(out).decode("utf-8") == "✅ done"
+
+
+def test_query_stream_endpoint_streams_article(client_with_service):
+    """Test that /query/stream returns the full streamed output."""
+    client, service, run = client_with_service
+
+    response = client.post("/query/stream", json={"topic": "Python"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert response.text.startswith("🔍 Starting research on: Python")
+    assert response.text.endswith("Generated article: Python")
+
+
+async def test_single_flight_coalesces_identical_topics():
+    """Test that concurrent identical topics trigger only one pipeline run."""
+    release = threading.Event()
+    service = SlowRefreshService(release)
+    first = asyncio.ensure_future(run_single_flight("python", "Python", service))
+    second = asyncio.ensure_future(run_single_flight("python", "python", service))
+    await asyncio.sleep(0.05)
+    release.set()
+
+    (first_payload, first_entry), (second_payload, second_entry) = await asyncio.gather(first, second)
+
+    assert first_payload == b'{"result":"Generated article: Python"}'
+    assert second_payload is first_payload
+    assert second_entry is first_entry
+    assert service.calls == 1
+
+
+async def test_single_flight_survives_caller_cancellation():
+    """Test that one caller going away does not cancel the shared run."""
+    release = threading.Event()
+    service = SlowRefreshService(release)
+    first = asyncio.ensure_future(run_single_flight("rust", "Rust", service))
+    second = asyncio.ensure_future(run_single_flight("rust", "Rust", service))
+    await asyncio.sleep(0.05)
+    first.cancel()
+    release.set()
+
+    payload, entry = await second
+    assert entry.value == "Generated article: Rust"
+    assert service.calls == 1
+
+
+def test_log_event_includes_event_and_fields(caplog):
+    """Test that structured events carry the event name and extra fields."""
+    import logging
+    from api.routes import _log_event
+
+    with caplog.at_level(logging.INFO, logger="api.routes"):
+        _log_event("Something happened", "something_happened", topic="Python")
+
+    record = caplog.records[-1]
+    assert record.event == "something_happened"
+    assert record.topic == "Python"
+
+
+def test_log_event_skipped_when_level_disabled(monkeypatch):
+    """Test that no record is built when the level is disabled."""
+    import logging
+    import api.routes
+
+    class FailingLogger(logging.Logger):
+        def _log(self, *args, **kwargs):
+            raise AssertionError("record built for a disabled log call")
+
+    monkeypatch.setattr(api.routes, "logger", FailingLogger("api.routes", level=logging.WARNING))
+
+    api.routes._log_event("Quiet", "quiet")
+
+
+def test_utc_timestamp_format():
+    """Test that the health timestamp is ISO-8601 UTC with second precision."""
+    from datetime import datetime, timezone
+    from api.routes import utc_timestamp
+
+    stamp = utc_timestamp()
+    parsed = datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+
+    assert stamp.endswith("Z")
+    assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 5
+
+
+def test_query_response_has_content_length(client_with_service):
+    """Test that article responses are sent with an explicit Content-Length."""
+    client, service, run = client_with_service
+
+    miss = client.post("/query", json={"topic": "Python", "stream": False})
+    hit = client.post("/query", json={"topic": "Python", "stream": False})
+
+    for response in (miss, hit):
+        assert response.headers["content-type"] == "application/json"
+        assert int(response.headers["content-length"]) == len(response.content)
+    assert hit.content == miss.content
+
+
+def test_app_survives_repeated_lifespans(monkeypatch, client_with_service):
+    """Test that the STORM worker pool is recreated when the app starts up again."""
+    from fastapi.testclient import TestClient
+    import main
+
+    _, service, run = client_with_service
+    service.warmup = lambda: None
+    monkeypatch.setattr(main, "get_storm_service", lambda: service)
+
+    try:
+        for topic in ("Python", "Rust"):
+            with TestClient(main.app) as client:
+                response = client.post("/query", json={"topic": topic, "stream": False})
+            assert response.json()["result"] == f"Generated article: {topic}"
+    finally:
+        # Later tests use the app without a lifespan
+        main.start_storm_executor()
+
+
+def test_lifespan_builds_storm_service_off_the_event_loop(monkeypatch):
+    """Test that the service is constructed and warmed up on a worker thread."""
+    import threading
+    from fastapi.testclient import TestClient
+    import main
+
+    threads = []
+
+    class WarmService:
+        def warmup(self):
+            threads.append(("warmup", threading.current_thread()))
+
+    def build_service():
+        threads.append(("build", threading.current_thread()))
+        return WarmService()
+
+    monkeypatch.setattr(main, "get_storm_service", build_service)
+    try:
+        with TestClient(main.app) as client:
+            loop_thread = client.portal.call(lambda: threading.current_thread())
+    finally:
+        main.start_storm_executor()
+
+    assert [name for name, _ in threads] == ["build", "warmup"]
+    assert all(thread is not loop_thread for _, thread in threads)
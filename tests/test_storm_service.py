@@ -2,6 +2,7 @@
 
 import pytest
 from core.storm_service import StormService
+from tests.conftest import write_article
 from knowledge_storm import STORMWikiLMConfigs
 
 
@@ -88,4 +89,390 @@ def test_run_clears_memory():
     size2 = len(files2)
     
     # After clearing, first storage should be empty or different
-    assert size1 == 0 or files1 != files2
\ No newline at end of file
+    assert size1 == 0 or files1 != files2
+
+def test_warmup_loads_shared_encoder_once(monkeypatch):
+    """Test that warmup loads the retrieval encoder once and reuses it."""
+    import core.storm_service as storm_service
+    from knowledge_storm.storm_wiki.modules.storm_dataclass import StormInformationTable
+
+    loaded = []
+
+    class FakeEncoder:
+        def __init__(self, name):
+            loaded.append(name)
+
+        def encode(self, texts):
+            return texts
+
+    monkeypatch.setattr(storm_service, "SentenceTransformer", FakeEncoder)
+    monkeypatch.setattr(storm_service, "_shared_encoder", None)
+
+    service = StormService()
+    service.warmup()
+    service.warmup()
+
+    table = StormInformationTable(conversations=[])
+    table.prepare_table_for_retrieval()
+
+    assert loaded == ["paraphrase-MiniLM-L6-v2"]
+    assert table.encoder is storm_service._shared_encoder
+
+
+def test_storm_service_singleton_under_concurrency(monkeypatch):
+    """Test that racing callers still construct only one StormService."""
+    import concurrent.futures
+    import api.routes
+
+    monkeypatch.setattr(api.routes, "_storm_service", None)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        services = list(executor.map(lambda _: api.routes.get_storm_service(), range(16)))
+
+    assert all(service is services[0] for service in services)
+
+
+def test_clients_share_pooled_http_session(monkeypatch):
+    """Test that LLM and search calls go through one shared HTTP session."""
+    import core.storm_service as storm_service
+
+    calls = []
+
+    class FakeResponse:
+        ok = True
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"choices": [], "organic": []}
+
+    class FakeSession:
+        def post(self, url, **kwargs):
+            calls.append(url)
+            return FakeResponse()
+
+    monkeypatch.setattr(storm_service, "_http_session", FakeSession())
+    service = StormService()
+
+    service.lm_configs.article_gen_lm._create_completion("Hello")
+    service.retriever.serper_runner({"q": "Python"})
+
+    assert calls == [
+        "https://api.deepseek.com/v1/chat/completions",
+        "https://google.serper.dev/search",
+    ]
+
+
+def test_serper_search_times_out_and_raises_on_error_status(monkeypatch):
+    """Test that searches carry a timeout and a failed response raises instead of being parsed."""
+    import core.storm_service as storm_service
+
+    sent = []
+
+    class FakeResponse:
+        ok = False
+        reason = "Forbidden"
+        status_code = 403
+
+        def json(self):
+            raise AssertionError("error responses must not be parsed")
+
+    class FakeSession:
+        def post(self, url, **kwargs):
+            sent.append(kwargs)
+            return FakeResponse()
+
+    monkeypatch.setattr(storm_service, "_http_session", FakeSession())
+    monkeypatch.setenv("SERPER_TIMEOUT", "5")
+    service = StormService()
+
+    with pytest.raises(RuntimeError, match="status code 403"):
+        service.retriever.serper_runner({"q": "Python"})
+
+    assert sent[0]["timeout"] == 5.0
+
+
+def test_http_session_is_created_once_and_closed():
+    """Test that the shared HTTP session is reused until it is closed."""
+    from core.storm_service import close_http_session, get_http_session
+
+    session = get_http_session()
+
+    assert get_http_session() is session
+    close_http_session()
+    assert get_http_session() is not session
+    close_http_session()
+
+
+def test_run_returns_cached_article(monkeypatch):
+    """Test that a cached article is returned without running the pipeline."""
+    import core.storm_service as storm_service
+    from utils.cache import TTLCache
+
+    def fail_runner(*args, **kwargs):
+        raise AssertionError("pipeline should not run on a cache hit")
+
+    monkeypatch.setattr(storm_service, "_article_cache", TTLCache(maxsize=10, ttl=60))
+    monkeypatch.setattr(storm_service, "STORMWikiRunner", fail_runner)
+    service = StormService()
+    key = service._cache_key("Python", service._get_pipeline_config())
+    storm_service._article_cache.set(key, "Cached article")
+
+    assert service.run("  python ") == "Cached article"
+    assert list(service.run_with_streaming("Python"))[-1] == "Cached article"
+    assert storm_service.get_cache_stats() == {"hits": 2, "misses": 0, "size": 1}
+
+
+def test_cache_key_depends_on_pipeline_config():
+    """Test that different pipeline stages do not share cached articles."""
+    service = StormService()
+    config = service._get_pipeline_config()
+
+    assert service._cache_key("Python", config) != service._cache_key(
+        "Python", {**config, "do_polish_article": not config["do_polish_article"]}
+    )
+
+
+def _run_with_progress(runner, topic, callback_handler, **kwargs):
+    callback_handler.on_identify_perspective_start(topic=topic)
+    callback_handler.on_information_gathering_start(perspective="History")
+    write_article(runner, topic, "Article body")
+
+
+def test_run_with_streaming_yields_progress_then_article(fake_storm_service):
+    """Test that streamed progress is delivered in order and the stream ends with the article."""
+    runs = []
+
+    def run(runner, topic, **kwargs):
+        runs.append(topic)
+        _run_with_progress(runner, topic, **kwargs)
+
+    service = fake_storm_service(run)
+
+    chunks = list(service.run_with_streaming("Python", use_cache=False))
+    output = "".join(chunks)
+
+    assert output.index("Analyzing perspectives") < output.index("Gathering information")
+    assert chunks[-2] == (
+        "\n✅ Research phase complete\n\n📝 Outline generated\n\n✍️  Article generated\n\n"
+        "📄 Final Article:\n────────────────────────────────────────\n\n"
+    )
+    assert chunks[-1] == "Article body"
+    assert runs == ["Python"]
+
+
+def test_run_with_streaming_reports_failure_once(fake_storm_service):
+    """Test that a failed run yields a single error line and raises the error unwrapped once."""
+    def run(runner, topic, **kwargs):
+        raise RuntimeError("LM unavailable")
+
+    service = fake_storm_service(run)
+    chunks = []
+
+    with pytest.raises(Exception) as excinfo:
+        for chunk in service.run_with_streaming("Python", use_cache=False):
+            chunks.append(chunk)
+
+    assert [chunk for chunk in chunks if chunk.startswith("❌")] == [
+        "❌ Pipeline execution failed: LM unavailable\n"
+    ]
+    assert str(excinfo.value).count("Pipeline execution failed") == 1
+
+
+def test_runner_args_resolved_once(monkeypatch):
+    """Test that environment configuration is read at construction only."""
+    monkeypatch.setenv("MAX_CONV_TURN", "5")
+    monkeypatch.setenv("DO_POLISH_ARTICLE", "false")
+    service = StormService()
+    monkeypatch.setenv("MAX_CONV_TURN", "9")
+    monkeypatch.setenv("DO_POLISH_ARTICLE", "true")
+
+    args = service._build_runner_args("/tmp/out")
+
+    assert args.output_dir == "/tmp/out"
+    assert args.max_conv_turn == 5
+    assert service._get_pipeline_config()["do_polish_article"] is False
+    assert service._build_runner_args("/tmp/other").output_dir == "/tmp/other"
+    assert args.output_dir == "/tmp/out"
+
+
+def test_undersized_thread_pool_logs_warning(monkeypatch, caplog):
+    """Test that a thread pool smaller than the research fan-out is reported."""
+    import logging
+
+    monkeypatch.setenv("MAX_PERSPECTIVE", "4")
+    monkeypatch.setenv("MAX_THREAD_NUM", "2")
+
+    with caplog.at_level(logging.WARNING, logger="core.storm_service"):
+        StormService()
+
+    record = next(r for r in caplog.records if getattr(r, "event", None) == "storm_thread_pool_undersized")
+    assert record.conversations == 5
+
+
+def test_runner_is_reused_across_runs(fake_storm_service):
+    """Test that sequential runs share one STORM runner instead of rebuilding it."""
+    built = []
+    service = fake_storm_service(runners=built)
+
+    assert service.run("Python", use_cache=False) == "Article on Python"
+    assert service.run("Rust", use_cache=False) == "Article on Rust"
+    assert len(built) == 1
+
+
+def test_format_error_omits_traceback_unless_debug(monkeypatch):
+    """Test that tracebacks are only embedded in error messages in debug mode."""
+    monkeypatch.delenv("STORM_DEBUG", raising=False)
+    service = StormService()
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        error = service._format_error("Pipeline execution failed", "boom")
+
+    assert str(error) == "STORM Pipeline execution failed: boom"
+
+    monkeypatch.setenv("STORM_DEBUG", "1")
+    debug_service = StormService()
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        debug_error = debug_service._format_error("Pipeline execution failed", "boom")
+
+    assert "Traceback" in str(debug_error)
+
+
+def test_runs_write_nothing_to_disk(fake_storm_service):
+    """Test that runs use a real output directory but keep every file in memory."""
+    import os
+    from knowledge_storm.utils import FileIOHelper
+
+    output_dirs = []
+    disk_files = []
+
+    def run(runner, topic, **kwargs):
+        article_dir = os.path.join(runner.args.output_dir, topic)
+        os.makedirs(article_dir, exist_ok=True)
+        output_dirs.append(runner.args.output_dir)
+        FileIOHelper.dump_json({"topic": topic}, os.path.join(article_dir, "url_to_info.json"))
+        assert FileIOHelper.load_json(os.path.join(article_dir, "url_to_info.json")) == {"topic": topic}
+        write_article(runner, topic)
+        disk_files.extend(f for _, _, files in os.walk(runner.args.output_dir) for f in files)
+
+    service = fake_storm_service(run)
+
+    assert service.run("Python", use_cache=False) == "Article on Python"
+    assert list(service.run_with_streaming("Rust", use_cache=False))[-1] == "Article on Rust"
+
+    assert disk_files == []
+    assert len(output_dirs) == 2
+    assert os.path.dirname(output_dirs[0]) == os.path.dirname(output_dirs[1])
+    assert not any(os.path.exists(output_dir) for output_dir in output_dirs)
+
+
+def test_run_batch_keeps_concurrent_runs_apart(fake_storm_service, monkeypatch):
+    """Test that concurrent runs each return their own article and clean up after themselves."""
+    import threading
+    import core.storm_service as storm_service
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def run(runner, topic, **kwargs):
+        write_article(runner, topic)
+        barrier.wait()
+
+    monkeypatch.setattr(storm_service, "_article_cache", storm_service.TTLCache(maxsize=10, ttl=60))
+    storm_service.clear_memory_storage()
+    service = fake_storm_service(run)
+
+    articles = service.run_batch(["Python", "Rust", "Go"], max_concurrency=3)
+
+    assert articles == ["Article on Python", "Article on Rust", "Article on Go"]
+    assert storm_service.get_memory_storage_size() == 0
+
+
+def test_run_files_are_private_to_the_run(fake_storm_service):
+    """Test that a run's files live in its own store, untouched by other threads."""
+    import threading
+    import core.storm_service as storm_service
+
+    def run(runner, topic, **kwargs):
+        write_article(runner, topic)
+        other = threading.Thread(target=storm_service.clear_memory_storage)
+        other.start()
+        other.join()
+        assert storm_service.get_memory_storage_size() == 1
+
+    storm_service.clear_memory_storage()
+    service = fake_storm_service(run)
+
+    assert service.run("Python", use_cache=False) == "Article on Python"
+    assert storm_service.get_memory_storage_size() == 0
+
+
+async def test_stream_matches_run_with_streaming(fake_storm_service):
+    """Test that the async stream yields progress then the article, like run_with_streaming."""
+    service = fake_storm_service(_run_with_progress)
+
+    chunks = [chunk async for chunk in service.stream("Python", use_cache=False)]
+
+    assert "".join(chunks) == "".join(service.run_with_streaming("Python", use_cache=False))
+    assert "Analyzing perspectives" in chunks[1]
+    assert chunks[-1] == "Article body"
+
+
+async def test_stream_reports_pipeline_failure(fake_storm_service):
+    """Test that a failed run yields an error line and then raises."""
+    def run(runner, topic, callback_handler, **kwargs):
+        callback_handler.on_identify_perspective_start(topic=topic)
+        raise RuntimeError("LM unavailable")
+
+    service = fake_storm_service(run)
+    chunks = []
+
+    with pytest.raises(Exception, match="LM unavailable"):
+        async for chunk in service.stream("Python", use_cache=False):
+            chunks.append(chunk)
+
+    assert chunks[-1] == "❌ Pipeline execution failed: LM unavailable\n"
+
+
+async def test_stream_stops_recording_progress_when_abandoned(fake_storm_service):
+    """Test that progress is no longer buffered once the consumer closes the stream mid-run."""
+    import threading
+
+    release = threading.Event()
+    handlers = []
+
+    def run(runner, topic, callback_handler, **kwargs):
+        handlers.append(callback_handler)
+        callback_handler.on_identify_perspective_start(topic=topic)
+        release.wait(timeout=5)
+        callback_handler.on_information_gathering_start(perspective="History")
+        write_article(runner, topic, "Article body")
+
+    service = fake_storm_service(run)
+
+    stream = service.stream("Python", use_cache=False)
+    await stream.__anext__()
+    assert "Analyzing perspectives" in await stream.__anext__()
+    await stream.aclose()
+    release.set()
+
+    assert handlers[0].enabled is False
+
+
+def test_warmup_prebuilds_a_runner(fake_storm_service, monkeypatch):
+    """Test that warmup builds a runner up front so the first run does not."""
+    import core.storm_service as storm_service
+
+    monkeypatch.setattr(storm_service, "_get_shared_encoder", lambda: None)
+    built = []
+    service = fake_storm_service(runners=built)
+
+    service.warmup()
+    service.warmup()
+    assert len(built) == 1
+
+    assert service.run("Python", use_cache=False) == "Article on Python"
+    assert len(built) == 1
@@ -1,28 +1,27 @@
+import sys
+
 import requests
 import json
 
 print("🚀 Testing TRUE streaming endpoint with STORM callbacks...")
 print("=" * 60)
 
-# Send request with streaming enabled
-response = requests.post(
+# Send request with streaming enabled; the context manager releases the
+# connection as soon as the stream is done
+with requests.post(
     "http://localhost:8000/query/stream",
     json={"topic": "Python Programming"},
     stream=True  # This enables streaming!
-)
-
-print("✅ Request sent. Streaming progress in real-time:")
-print("=" * 60)
+) as response:
+    print("✅ Request sent. Streaming progress in real-time:")
+    print("=" * 60)
 
-# Print chunks as they arrive (decoded)
-for chunk in response:
-    try:
-        # Decode bytes to string
-        decoded = chunk.decode('utf-8')
-        print(decoded, end="", flush=True)
-    except:
-        # Fallback for any unexpected encoding issues
-        print(chunk, end="", flush=True)
+    # Decode incrementally so multi-byte characters split across chunks
+    # (emoji in progress lines) come out intact
+    response.encoding = "utf-8"
+    for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
 
 print("\n" + "=" * 60)
 print("✅ Streaming complete!")
\ No newline at end of file
@@ -161,4 +161,297 @@ def test_multiple_callbacks_in_order():
     assert len(messages) == 3
     assert "Analyzing" in messages[0]
     assert "general perspective" in messages[1]
-    assert "Gathering" in messages[2]
\ No newline at end of file
+    assert "Gathering" in messages[2]
+
+def test_wait_for_progress_wakes_on_new_message():
+    """Test that a waiting consumer is woken as soon as a message arrives."""
+    import threading
+    import time
+
+    handler = StreamingCallbackHandler()
+    timer = threading.Timer(0.05, handler.add_progress, args=("🔍 Starting",))
+    timer.start()
+
+    start = time.monotonic()
+    messages = handler.wait_for_progress(timeout=5)
+
+    assert messages == ["🔍 Starting"]
+    assert time.monotonic() - start < 2
+    timer.join()
+
+
+def test_put_skips_notify_without_waiting_consumer(monkeypatch):
+    """Test that producers only signal the condition when a consumer is parked on it."""
+    from core.streaming_callback import MessageBuffer
+
+    buffer = MessageBuffer()
+    notified = []
+    monkeypatch.setattr(buffer._cond, "notify", lambda n=1: notified.append(n))
+
+    for i in range(10):
+        buffer.put(f"message {i}")
+
+    assert notified == []
+    assert len(buffer.drain()) == 10
+
+
+def test_wait_for_progress_times_out_empty():
+    """Test that waiting with no messages returns an empty list after the timeout."""
+    handler = StreamingCallbackHandler()
+
+    assert handler.wait_for_progress(timeout=0.01) == []
+
+
+def test_finish_releases_waiting_consumer():
+    """Test that finishing wakes a consumer and ends the stream after draining."""
+    import threading
+
+    handler = StreamingCallbackHandler()
+    handler.add_progress("last message")
+    threading.Timer(0.05, handler.finish).start()
+
+    assert handler.wait_for_progress() == ["last message"]
+    assert handler.wait_for_progress() == []
+    assert handler.message_queue.closed
+
+
+def test_clear_progress_reopens_finished_handler():
+    """Test that a finished handler can be reused for another run."""
+    handler = StreamingCallbackHandler()
+    handler.finish()
+
+    handler.clear_progress()
+    handler.add_progress("next run")
+
+    assert not handler.message_queue.closed
+    assert handler.get_progress() == ["next run"]
+
+
+def test_dialogue_turn_question_attribute_is_remembered():
+    """Test that the question attribute is resolved once per dialogue turn type."""
+    from core.streaming_callback import _question_attr_by_type
+
+    class ConvTurn:
+        def __init__(self, question):
+            self.conv_q = question
+
+    class QueryTurn:
+        def __init__(self, question):
+            self.query = question
+
+    handler = StreamingCallbackHandler()
+
+    handler.on_dialogue_turn_end(dlg_turn=ConvTurn("What is Python?"))
+    handler.on_dialogue_turn_end(dlg_turn=ConvTurn("Who created it?"))
+    handler.on_dialogue_turn_end(dlg_turn=QueryTurn("When was it released?"))
+
+    messages = handler.get_progress()
+    assert "Q1: What is Python?" in messages[0]
+    assert "Q2: Who created it?" in messages[1]
+    assert "Q3: When was it released?" in messages[2]
+    assert _question_attr_by_type[ConvTurn] == "conv_q"
+    assert _question_attr_by_type[QueryTurn] == "query"
+    assert handler.get_stage_info()["current_query"] == "When was it released?"
+
+
+def test_perspective_listing_is_a_single_message():
+    """Test that identified perspectives are reported as one multi-line message."""
+    handler = StreamingCallbackHandler()
+
+    handler.on_identify_perspective_end(perspectives=["History", "Applications"])
+
+    assert handler.get_progress() == [
+        "📋 Identified 2 perspectives:\n   1. History\n   2. Applications"
+    ]
+
+
+def test_clear_progress_discards_without_draining(monkeypatch):
+    """Test that clearing progress drops pending messages without popping them one by one."""
+    from core.streaming_callback import MessageBuffer
+
+    handler = StreamingCallbackHandler()
+    for i in range(100):
+        handler.add_progress(f"message {i}")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("clear_progress should not drain messages individually")
+
+    monkeypatch.setattr(MessageBuffer, "get", fail)
+    monkeypatch.setattr(MessageBuffer, "get_nowait", fail)
+    handler.clear_progress()
+
+    assert handler.message_queue.empty()
+    assert handler.get_progress() == []
+
+
+def test_get_summary_keeps_drained_messages():
+    """Test that the summary covers every message since the last clear, even once streamed."""
+    handler = StreamingCallbackHandler()
+    handler.add_progress("🔍 Starting research")
+    handler.get_progress()
+    handler.add_progress("✅ Done")
+
+    assert handler.get_summary() == "🔍 Starting research\n✅ Done"
+
+    handler.clear_progress()
+    assert handler.get_summary() == ""
+
+
+def test_message_generator_drains_in_batches(monkeypatch):
+    """Test that the generator yields every message without taking them one at a time."""
+    from core.streaming_callback import MessageBuffer
+
+    handler = StreamingCallbackHandler()
+    for i in range(5):
+        handler.add_progress(f"message {i}")
+    handler.finish()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("messages should be drained in batches")
+
+    monkeypatch.setattr(MessageBuffer, "get", fail)
+
+    assert list(handler.get_message_generator()) == [f"message {i}" for i in range(5)]
+
+
+async def test_stream_wakes_on_progress_from_another_thread():
+    """Test that the async stream is woken by producers on other threads and ends on finish."""
+    import threading
+
+    handler = StreamingCallbackHandler()
+
+    def produce():
+        handler.add_progress("🔍 Starting")
+        handler.add_progress("✅ Done")
+        handler.finish()
+
+    threading.Timer(0.05, produce).start()
+
+    batches = [batch async for batch in handler.stream()]
+
+    assert [message for batch in batches for message in batch] == ["🔍 Starting", "✅ Done"]
+    assert handler.message_queue._listener is None
+
+
+def test_disabled_handler_records_nothing():
+    """Test that a disabled handler ignores callbacks without queueing messages."""
+    handler = StreamingCallbackHandler(topic="Python", enabled=False)
+
+    handler.on_identify_perspective_start(topic="Python")
+    handler.on_information_gathering_end(num_queries=3)
+    handler.add_progress("🔍 Starting")
+
+    assert handler.get_progress() == []
+    assert handler.get_summary() == ""
+
+
+def test_handler_pool_reuses_finished_handlers():
+    """Test that finished handlers are reused, reset, and unfinished ones are never pooled."""
+    from core import streaming_callback
+    from core.streaming_callback import acquire_handler, release_handler
+
+    streaming_callback._idle_handlers.clear()
+    handler = acquire_handler("Python")
+    handler.enabled = False
+    handler.add_progress("🔍 Starting")
+    handler.finish()
+    release_handler(handler)
+
+    reused = acquire_handler("Rust")
+
+    assert reused is handler
+    assert reused.enabled
+    assert not reused.message_queue.closed
+    assert reused.get_progress() == []
+    assert reused.get_summary() == ""
+    assert reused.get_stage_info()["topic"] == "Rust"
+
+    release_handler(reused)
+    assert acquire_handler("Go") is not reused
+
+
+def test_stage_info_tracks_progress_and_resets():
+    """Test that stage information is updated by callbacks and zeroed, not replaced, on clear."""
+    handler = StreamingCallbackHandler(topic="Python")
+    stage_info = handler._stage_info
+
+    handler.on_identify_perspective_end(perspectives=["History", "Applications"])
+    handler.on_information_gathering_start(perspective="History")
+    info = handler.get_stage_info()
+
+    assert info["perspectives_count"] == 2
+    assert info["current_perspective"] == "History"
+    assert info["topic"] == "Python"
+
+    handler.clear_progress()
+
+    assert handler._stage_info is stage_info
+    assert handler.get_stage_info() == {
+        "perspectives_count": 0,
+        "dialogue_turns_count": 0,
+        "current_perspective": None,
+        "current_query": None,
+        "topic": "Python",
+        "perspectives": (),
+    }
+
+
+def test_get_summary_with_concurrent_producers():
+    """Test that messages from concurrent research threads are never interleaved in the summary."""
+    import threading
+
+    handler = StreamingCallbackHandler()
+
+    def produce(perspective):
+        for turn in range(200):
+            handler.add_progress(f"{perspective} ✓ {turn}")
+
+    threads = [threading.Thread(target=produce, args=(p,)) for p in ("History", "Applications", "Syntax")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    lines = handler.get_summary().split("\n")
+
+    assert len(lines) == 600
+    assert sorted(lines) == sorted(
+        f"{p} ✓ {turn}" for p in ("History", "Applications", "Syntax") for turn in range(200)
+    )
+
+
+def test_message_generator_waits_through_pauses_until_finish():
+    """Test that a quiet spell does not end the generator, but finish() ends it at once."""
+    import threading
+    import time
+
+    handler = StreamingCallbackHandler()
+
+    def produce():
+        handler.add_progress("🔍 Starting")
+        time.sleep(0.3)
+        handler.add_progress("✅ Done")
+        handler.finish()
+
+    threading.Thread(target=produce).start()
+    start = time.monotonic()
+
+    assert list(handler.get_message_generator()) == ["🔍 Starting", "✅ Done"]
+    assert time.monotonic() - start < 2
+
+
+def test_reset_swaps_out_pending_messages():
+    """Test that resetting a buffer swaps its pending messages out in one step and reopens it."""
+    from core.streaming_callback import MessageBuffer
+
+    buffer = MessageBuffer()
+    for i in range(1000):
+        buffer.put(f"message {i}")
+    buffer.close()
+    pending = buffer._messages
+
+    buffer.reset()
+
+    assert buffer._messages is not pending
+    assert buffer.empty()
+    assert not buffer.closed
@@ -0,0 +1,173 @@
+"""
+Response Cache Module
+
+This module provides a small in-process cache for generated articles so that
+repeated topics are served without re-running the STORM pipeline.
+
+Entries expire after a TTL but are kept until evicted by the LRU policy, so a
+stale copy can still be served when regenerating the article fails.
+
+Components:
+    - CacheEntry: Cached value with generation and staleness timestamps
+    - TTLCache: Thread-safe LRU cache whose entries go stale after a TTL
+    - normalize_topic: Build the cache key for a research topic
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class CacheEntry(NamedTuple):
+    """
+    A cached value with its freshness window.
+
+    Attributes:
+        generated_at: Monotonic time the value was stored
+        stale_at: Monotonic time after which the value is considered stale
+        value: The cached payload
+    """
+
+    generated_at: float
+    stale_at: float
+    value: Any
+
+    def is_fresh(self) -> bool:
+        """Return True while the entry is within its TTL."""
+        return time.monotonic() < self.stale_at
+
+    def remaining_ttl(self) -> int:
+        """Return the number of whole seconds until the entry goes stale."""
+        return max(0, int(self.stale_at - time.monotonic()))
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with per-entry TTL.
+
+    Lookups return the entry regardless of freshness; callers decide whether
+    a stale entry is acceptable (e.g. as a fallback on backend errors).
+
+    Attributes:
+        maxsize: Maximum number of entries kept before LRU eviction
+        ttl: Seconds an entry stays fresh after being stored
+        hits: Number of lookups that found an entry
+        misses: Number of lookups that found nothing
+
+    Example:
+        >>> cache = TTLCache(maxsize=100, ttl=3600)
+        >>> cache.set("python", "article text")
+        >>> entry = cache.get("python")
+        >>> entry.is_fresh()
+        True
+    """
+
+    def __init__(self, maxsize: int = 100, ttl: float = 3600) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before LRU eviction
+            ttl: Seconds an entry stays fresh after being stored
+        """
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up an entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[CacheEntry]: The entry (fresh or stale), or None if absent
+        """
+        with self._lock:
+            entry: Optional[CacheEntry] = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def set(self, key: str, value: Any) -> CacheEntry:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Payload to cache
+
+        Returns:
+            CacheEntry: The newly stored entry
+        """
+        now: float = time.monotonic()
+        entry = CacheEntry(generated_at=now, stale_at=now + self.ttl, value=value)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Remove a single entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bool: True if an entry was removed
+        """
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> int:
+        """
+        Remove all entries.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            count: int = len(self._entries)
+            self._entries.clear()
+            return count
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report lookup counters and current size.
+
+        Returns:
+            Dict[str, int]: hits, misses and size
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def normalize_topic(topic: str) -> str:
+    """
+    Build a cache key for a topic.
+
+    Args:
+        topic: Research topic as submitted by the client
+
+    Returns:
+        str: Whitespace-stripped, lowercased topic
+
+    Example:
+        >>> normalize_topic("  Python Programming ")
+        'python programming'
+    """
+    return topic.strip().lower()
@@ -6,15 +6,44 @@ All logs are formatted as JSON for easy parsing by log aggregators and monitorin
 
 Components:
     - JSONFormatter: Custom formatter for JSON log output
+    - RequestIDFilter: Stamp the current request ID onto every record
+    - SamplingFilter: Keep one in N records below WARNING
+    - StaticFieldsFilter: Add fixed fields (e.g. service name) to a logger's records
     - setup_logging: Configure root logger with JSON formatter
     - get_logger: Get a named logger instance
+    - log_event: Emit a structured event record, skipped cheaply when disabled
 """
 
+import atexit
+import functools
+import itertools
 import logging
-import json
+import logging.handlers
+import os
+import queue
 import sys
-from datetime import datetime
-from typing import Any, Dict
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, TextIO
+
+import orjson
+
+from utils.middleware import REQUEST_ID_VAR
+
+
+# LogRecord attributes set by logging itself; anything else came from extra=
+_STANDARD_ATTRS: frozenset = frozenset({
+    'name', 'msg', 'args', 'created', 'filename', 'funcName',
+    'levelname', 'levelno', 'lineno', 'module', 'msecs',
+    'message', 'pathname', 'process', 'processName', 'relativeCreated',
+    'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info',
+    'taskName',  # added in Python 3.12
+})
+
+# Attribute count of a record logged without extra=. LogRecord.__init__ sets
+# these first, so anything from extra= or a filter comes after them in __dict__
+_BASE_ATTR_COUNT: int = len(logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__)
 
 
 class JSONFormatter(logging.Formatter):
@@ -22,7 +51,9 @@ class JSONFormatter(logging.Formatter):
     JSON formatter for structured logging.
 
     Formats log records as JSON strings with consistent field names
-    for easy parsing by log aggregation systems.
+    for easy parsing by log aggregation systems. Records are serialized
+    with orjson; extra fields it cannot encode natively are written as
+    their str().
 
     Attributes:
         None
@@ -52,66 +83,383 @@ class JSONFormatter(logging.Formatter):
             >>> json_log = formatter.format(log_record)
             >>> print(json_log)
         """
+        msg: Any = record.msg
         log_entry: Dict[str, Any] = {
             "level": record.levelname,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "message": record.getMessage(),
-        }
-
-        standard_attrs = {
-            'name', 'msg', 'args', 'created', 'filename', 'funcName',
-            'levelname', 'levelno', 'lineno', 'module', 'msecs',
-            'message', 'pathname', 'process', 'processName', 'relativeCreated',
-            'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info'
+            # Left to orjson's native datetime encoding: caching a formatted
+            # per-second prefix and appending microseconds measured slower
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
+            # Plain string messages without %-args need no formatting
+            "message": msg if type(msg) is str and not record.args else record.getMessage(),
         }
 
-        for key, value in record.__dict__.items():
-            if key not in standard_attrs:
-                log_entry[key] = value
+        attrs: Dict[str, Any] = record.__dict__
+        if len(attrs) > _BASE_ATTR_COUNT:
+            # Only scan what was added after __init__; "message" may
+            # still be there if another formatter saw the record first
+            for key, value in itertools.islice(attrs.items(), _BASE_ATTR_COUNT, None):
+                if key not in _STANDARD_ATTRS:
+                    log_entry[key] = value
 
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_entry)
+        return orjson.dumps(log_entry, default=str, option=orjson.OPT_UTC_Z).decode("utf-8")
 
 
-def setup_logging(level: str = "INFO") -> None:
+class RequestIDFilter(logging.Filter):
+    """
+    Logging filter that tags each record with the current request ID.
+
+    Callers no longer need to pass the ID via extra=; JSONFormatter picks it
+    up like any other extra field. The filter must run on the logging
+    caller's thread, where the request's context variable is set, so it is
+    attached to the queue handler rather than the listener's handler. An
+    explicit request_id passed via extra= is left as is.
+
+    Example:
+        >>> handler.addFilter(RequestIDFilter())
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Attach request_id to the record; never drops it.
+
+        Args:
+            record: The log record being emitted
+
+        Returns:
+            bool: Always True
+        """
+        if "request_id" not in record.__dict__:
+            record.request_id = REQUEST_ID_VAR.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Logging filter that keeps only every Nth record below WARNING.
+
+    Dropped records are rejected before they are queued, so they never reach
+    JSON encoding or the output stream. WARNING and above always pass.
+
+    Attributes:
+        rate: Keep one record in this many (1 keeps everything)
+
+    Example:
+        >>> handler.addFilter(SamplingFilter(rate=10))
+    """
+
+    def __init__(self, rate: int) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            rate: Keep one record in this many
+        """
+        super().__init__()
+        self.rate: int = max(1, rate)
+        # next() on itertools.count is atomic under the GIL, so no lock is needed
+        self._counter: "itertools.count[int]" = itertools.count(1)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether to keep the record.
+
+        Args:
+            record: The log record being emitted
+
+        Returns:
+            bool: True for WARNING and above, and for every rate-th other record
+        """
+        if record.levelno >= logging.WARNING:
+            return True
+        return next(self._counter) % self.rate == 0
+
+
+class StaticFieldsFilter(logging.Filter):
+    """
+    Logging filter that adds the same fields to every record of a logger.
+
+    The fields are stored once, when the logger is set up, instead of being
+    passed via extra= or read from the environment on each call. Fields
+    passed explicitly via extra= take precedence.
+
+    Attributes:
+        fields: Field names and values added to each record
+
+    Example:
+        >>> logger.addFilter(StaticFieldsFilter({"service": "storm-api"}))
+    """
+
+    def __init__(self, fields: Dict[str, Any]) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            fields: Field names and values added to each record
+        """
+        super().__init__()
+        self.fields: Dict[str, Any] = dict(fields)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Add the static fields to the record; never drops it.
+
+        Args:
+            record: The log record being emitted
+
+        Returns:
+            bool: Always True
+        """
+        attrs: Dict[str, Any] = record.__dict__
+        for key, value in self.fields.items():
+            attrs.setdefault(key, value)
+        return True
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a listener in the same process.
+
+    The stock prepare() formats the record up front and strips exc_info so it
+    can be pickled to another process, which would put the formatting back on
+    the caller's thread. Here only the %-style arguments are merged (they may
+    be mutated after the call returns); formatting is left to the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args or type(record.msg) is not str:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that leaves flushing to its listener.
+
+    StreamHandler flushes after every record, costing a write syscall per
+    log line. Here records stay in the stream's buffer until the
+    _BatchingQueueListener flushes it at the end of each batch.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that handles records in batches and flushes once per batch.
+
+    After the first record of a batch arrives, the listener keeps taking
+    records until max_batch have been handled or max_delay seconds have
+    passed, then flushes its handlers. A burst of records therefore shares
+    one write, and a lone record is written at most max_delay later.
+    Records still queued when stop() is called are written before it returns.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.SimpleQueue[logging.LogRecord]",
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        max_batch: int = 512,
+        max_delay: float = 0.1,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.max_batch: int = max_batch
+        self.max_delay: float = max_delay
+
+    def _monitor(self) -> None:
+        log_queue = self.queue
+        sentinel = self._sentinel
+        stopping: bool = False
+        while not stopping:
+            record = log_queue.get()
+            if record is sentinel:
+                break
+            self.handle(record)
+            handled: int = 1
+            deadline: float = time.monotonic() + self.max_delay
+            while handled < self.max_batch:
+                timeout: float = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    record = log_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if record is sentinel:
+                    stopping = True
+                    break
+                self.handle(record)
+                handled += 1
+            for handler in self.handlers:
+                handler.flush()
+
+
+# Buffer size of the stream records are written through
+LOG_BUFFER_SIZE: int = 8192
+
+# Most records written per batch, and longest a batch stays open (seconds)
+LOG_BATCH_SIZE: int = 512
+LOG_FLUSH_INTERVAL: float = 0.1
+
+
+def _open_log_stream() -> TextIO:
+    """
+    Open a block-buffered UTF-8 text stream on stdout's file descriptor.
+
+    Falls back to sys.stdout itself when it is not backed by a file
+    descriptor (e.g. when replaced by a test runner).
+    """
+    try:
+        fd: int = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return sys.stdout
+    sys.stdout.flush()
+    return open(fd, "w", buffering=LOG_BUFFER_SIZE, encoding="utf-8", closefd=False)
+
+
+# Serializes get_logger() updates to a logger's StaticFieldsFilter
+_static_fields_lock: threading.Lock = threading.Lock()
+
+# Listener writing queued records to stdout; replaced on each setup_logging()
+_listener: "_BatchingQueueListener | None" = None
+
+
+def _stop_listener() -> None:
+    """Write out queued records and stop the logging listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def setup_logging(level: str = "INFO", sample_rate: "int | None" = None) -> None:
     """
     Configure structured JSON logging.
 
     Sets up the root logger with a JSON formatter and removes any existing
-    handlers to ensure clean configuration.
+    handlers to ensure clean configuration. Logging calls only enqueue the
+    record; a background listener thread formats it and writes it to
+    stdout, so request handlers never wait on JSON encoding or the stream.
+    Each record is tagged with the current request ID before it is queued.
+    With a sample rate above 1, only one in that many records below WARNING
+    is kept; the rest are dropped before they are queued.
+    Output is block-buffered and flushed once per batch of up to
+    LOG_BATCH_SIZE records or LOG_FLUSH_INTERVAL seconds, so bursts of
+    records share a write.
+    Called once at application startup; pending records are flushed at exit.
 
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        sample_rate: Keep one in this many records below WARNING; defaults
+            to the LOG_SAMPLE_RATE environment variable, or 1 (no sampling)
 
     Example:
         >>> setup_logging(level="DEBUG")
         >>> logger = get_logger(__name__)
         >>> logger.info("Application started")
     """
+    global _listener
+
+    log_level: int = getattr(logging, level.upper(), logging.INFO)
+    if sample_rate is None:
+        sample_rate = int(os.getenv("LOG_SAMPLE_RATE", "1"))
     root_logger: logging.Logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    root_logger.setLevel(log_level)
     root_logger.handlers.clear()
+    _stop_listener()
 
-    handler: logging.StreamHandler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(getattr(logging, level.upper(), logging.INFO))
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler: logging.StreamHandler = _BufferedStreamHandler(_open_log_stream())
+    handler.setLevel(log_level)
     handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(handler)
 
+    queue_handler: logging.Handler = _LocalQueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    if sample_rate > 1:
+        # Sample first so dropped records are not tagged either
+        queue_handler.addFilter(SamplingFilter(sample_rate))
+    queue_handler.addFilter(RequestIDFilter())
+    root_logger.addHandler(queue_handler)
+
+    _listener = _BatchingQueueListener(
+        log_queue, handler, respect_handler_level=True,
+        max_batch=LOG_BATCH_SIZE, max_delay=LOG_FLUSH_INTERVAL,
+    )
+    _listener.start()
 
-def get_logger(name: str) -> logging.Logger:
+
+@functools.lru_cache(maxsize=None)
+def _cached_logger(name: str) -> logging.Logger:
+    """Resolve a logger once per name, skipping logging's module-wide lock afterwards."""
+    return logging.getLogger(name)
+
+
+def get_logger(name: str, **static_fields: Any) -> logging.Logger:
     """
     Get a logger instance.
 
+    Loggers live for the whole process, so each name is resolved once and
+    later calls skip logging's module-wide lock. Static fields are added to
+    every record the logger emits through a single StaticFieldsFilter per
+    logger; later calls merge their fields into it, overriding earlier
+    values for the same field.
+
     Args:
         name: Name for the logger (typically __name__)
+        **static_fields: Fields to include in every record
 
     Returns:
         logging.Logger: Configured logger instance
 
     Example:
-        >>> logger = get_logger(__name__)
+        >>> logger = get_logger(__name__, service="storm-api")
         >>> logger.info("Log message")
     """
-    return logging.getLogger(name)
\ No newline at end of file
+    logger: logging.Logger = _cached_logger(name)
+    if static_fields:
+        with _static_fields_lock:
+            for existing in logger.filters:
+                if isinstance(existing, StaticFieldsFilter):
+                    # Swap in a new dict so concurrent filter() calls never see a partial update
+                    existing.fields = {**existing.fields, **static_fields}
+                    break
+            else:
+                logger.addFilter(StaticFieldsFilter(static_fields))
+    return logger
+
+
+def log_event(logger: logging.Logger, message: str, event: str, level: int = logging.INFO, **fields: Any) -> None:
+    """
+    Emit a structured log record tagged with the event name.
+
+    The level is checked first (logging caches the answer per logger), so a
+    disabled call returns before the extra dict and LogRecord are built.
+    The request ID is added by RequestIDFilter when the record is handled.
+
+    Args:
+        logger: Logger to emit on
+        message: Human-readable log message
+        event: Machine-readable event name
+        level: Logging level to emit at
+        **fields: Additional structured fields
+
+    Example:
+        >>> log_event(logger, "Query request received", "query_request_received", topic="Python")
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, message, extra={"event": event, **fields})
@@ -5,37 +5,51 @@ This module provides middleware for generating and tracking unique request IDs
 across all HTTP requests. This enables distributed tracing and debugging.
 
 Components:
-    - generate_request_id: Generate unique UUID-based request IDs
+    - REQUEST_ID_VAR: Context variable holding the current request ID
+    - generate_request_id: Generate unique random hex request IDs
     - get_request_id: Retrieve current request ID from context
-    - RequestIDMiddleware: FastAPI middleware for automatic request ID injection
+    - incoming_request_id: Read a valid client-supplied X-Request-ID header
+    - RequestIDMiddleware: ASGI middleware for automatic request ID injection
 """
 
-import uuid
+import re
+import secrets
 from contextvars import ContextVar
-from typing import Any
+from typing import Any, Optional, Tuple
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
-from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 request_id_context: ContextVar[str] = ContextVar("request_id", default="")
 
+# Public handle for hot paths that read the ID inline rather than via get_request_id()
+REQUEST_ID_VAR: ContextVar[str] = request_id_context
+
+# Client-supplied IDs are echoed into headers and logs, so only accept short
+# tokens made of characters that cannot break either
+MAX_REQUEST_ID_LENGTH: int = 64
+_REQUEST_ID_PATTERN: "re.Pattern[bytes]" = re.compile(rb"[A-Za-z0-9._-]{1,%d}" % MAX_REQUEST_ID_LENGTH)
+
+# Raw ASGI header name (lowercase bytes), built once for every response
+_HEADER_NAME: bytes = b"x-request-id"
+
 
 def generate_request_id() -> str:
     """
-    Generate a unique request ID using UUID4.
+    Generate a unique request ID from 128 random bits.
+
+    The bytes come straight from os.urandom via secrets.token_hex, which
+    avoids building a UUID object for every request.
 
     Returns:
-        str: UUID4-formatted request ID (36 characters with hyphens)
+        str: Request ID as 32 lowercase hex characters
 
     Example:
         >>> request_id = generate_request_id()
         >>> print(request_id)
-        >>> "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+        >>> "a1b2c3d4e5f67890abcdef1234567890"
     """
-    return str(uuid.uuid4())
+    return secrets.token_hex(16)
 
 
 def get_request_id() -> str:
@@ -53,14 +67,46 @@ def get_request_id() -> str:
     return request_id_context.get("")
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+def incoming_request_id(scope: Scope) -> Optional[str]:
+    """
+    Return the X-Request-ID sent by the client, if it is safe to reuse.
+
+    The header is accepted only when it is at most MAX_REQUEST_ID_LENGTH
+    characters of letters, digits, ".", "_" or "-". Anything else is ignored
+    so a fresh ID is generated instead.
+
+    Args:
+        scope: ASGI HTTP connection scope
+
+    Returns:
+        Optional[str]: The client's request ID, or None if absent or invalid
+
+    Example:
+        >>> incoming_request_id({"headers": [(b"x-request-id", b"abc-123")]})
+        'abc-123'
+    """
+    for name, value in scope.get("headers", ()):
+        if name == _HEADER_NAME:
+            if _REQUEST_ID_PATTERN.fullmatch(value):
+                return value.decode("ascii")
+            return None
+    return None
+
+
+class RequestIDMiddleware:
     """
     Middleware that adds a unique request ID to each HTTP request.
 
-    This middleware generates a unique ID for each incoming request, stores it
-    in a context variable for access throughout the request lifecycle, and adds
+    This middleware reuses the client's X-Request-ID when it passes
+    validation and otherwise generates a unique ID. It stores the ID in a
+    context variable for access throughout the request lifecycle, and adds
     it to the response headers for client-side tracking.
 
+    It is a plain ASGI middleware rather than a BaseHTTPMiddleware, so the
+    request is not run in a separate task and the response is passed through
+    untouched apart from the added header. The context variable stays set
+    until the response, streamed or not, has been fully sent.
+
     Attributes:
         app: The ASGI application to wrap
 
@@ -77,40 +123,42 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         Args:
             app: The ASGI application to wrap
         """
-        super().__init__(app)
+        self.app: ASGIApp = app
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and add request ID to headers.
 
-        Args:
-            request: The incoming HTTP request
-            call_next: The next middleware/route handler in the chain
+        Non-HTTP scopes (lifespan, websockets) are passed straight through.
 
-        Returns:
-            Response: HTTP response with X-Request-ID header added
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
 
         Example:
-            >>> # Automatically called by FastAPI for each request
-            >>> response = await call_next(request)
-            >>> response.headers["X-Request-ID"] = "uuid-here"
+            >>> # Automatically called by the ASGI server for each request
+            >>> await middleware(scope, receive, send)
         """
-        # Generate and set request ID in context
-        request_id: str = generate_request_id()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Reuse the caller's ID for cross-service tracing, else generate one
+        request_id: str = incoming_request_id(scope) or generate_request_id()
         token: Any = request_id_context.set(request_id)
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        try:
-            # Process the request
-            response: Response = await call_next(request)
+        header: Tuple[bytes, bytes] = (_HEADER_NAME, request_id.encode("ascii"))
 
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            return response
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Copy rather than append: the list may be the response's own raw_headers
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
         finally:
             # Clean up context (important for async/await)
-            request_id_context.reset(token)
\ No newline at end of file
+            request_id_context.reset(token)